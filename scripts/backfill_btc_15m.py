@@ -1,8 +1,17 @@
-from flare_ai_defai.market_data.binance import backfill_history
+from pathlib import Path
 
-out_path = "src/flare_ai_defai/crash_detection_system/data/btc_15m_data.csv"
+from flare_ai_defai.market_data.store import load_or_backfill
 
-df = backfill_history(symbol="BTCUSDT", interval="15m")
-df.to_csv(out_path, index=False)
+csv_path = Path("src/flare_ai_defai/crash_detection_system/data/btc_15m_data.csv")
+
+# The Parquet store is what the snapshot builder reads and appends to; only
+# a missing store triggers the full-history download, later runs fetch the
+# candles closed since the previous one.
+df = load_or_backfill(
+    csv_path.with_suffix(".parquet"), symbol="BTCUSDT", interval="15m"
+)
+
+# The CSV stays as the portable copy
+df.to_csv(csv_path, index=False)
 
 print("Saved rows:", len(df))
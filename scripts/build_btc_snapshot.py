@@ -5,17 +5,43 @@ Build BTC/USD market snapshot and write it to shared/latest_update.json.
 
 This script is the ONLY writer of the snapshot JSON.
 It uses deterministic outputs from RiskEngine (NO LLM).
+
+Run with --loop to keep one warm process that rebuilds the snapshot at
+every 15-minute candle close instead of paying interpreter + pandas
+startup per cron invocation.
 """
+import argparse
+import orjson
 import pandas as pd
-import json
 import os
+import requests
+import structlog
+import time
 from pathlib import Path
 from datetime import datetime, timezone
 
 from flare_ai_defai.crash_detection_system.integration import RiskAnalysisIntegration
 from flare_ai_defai.crash_detection_system.types import RiskAppetite
 from flare_ai_defai.flare.flare_price import get_btc_usd_price
-from flare_ai_defai.market_data.binance import update_latest
+from flare_ai_defai.market_data.binance import KLINE_DTYPES
+from flare_ai_defai.market_data.store import update_store, write_candles
+
+
+BAR_SECONDS = 15 * 60
+BAR_CLOSE_GRACE_SECONDS = 5  # let Binance publish the closed candle first
+
+STORE = Path("src/flare_ai_defai/crash_detection_system/data/btc_15m_data.parquet")
+SNAPSHOT_PATH = Path("shared/latest_update.json")
+
+# Deterministic demo defaults
+HORIZON_HOURS = 24
+RISK_PROFILE = RiskAppetite.MEDIUM
+
+# What a tick can fail with and still be retried on the next one: Binance
+# or network errors, store I/O, and malformed/missing candle data
+TICK_ERRORS = (requests.RequestException, OSError, ValueError)
+
+logger = structlog.get_logger(__name__)
 
 
 # ---------- helpers ----------
@@ -24,12 +50,11 @@ from flare_ai_defai.market_data.binance import update_latest
 
 
 def now_iso() -> str:
-    return (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _seconds_to_next_15m() -> float:
+    return BAR_SECONDS - time.time() % BAR_SECONDS + BAR_CLOSE_GRACE_SECONDS
 
 
 def atomic_write_json(path: Path, payload: dict) -> None:
@@ -38,27 +63,54 @@ def atomic_write_json(path: Path, payload: dict) -> None:
     """
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # orjson emits UTF-8 bytes directly; OPT_SERIALIZE_NUMPY lets numpy scalars
+    # from the risk engine through without float() casts.
+    data = orjson.dumps(
+        payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    )
+    # One buffered write; close() flushes before the rename.
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(data)
     os.replace(tmp, path)
 
 
 # ---------- main snapshot build ----------
 
-def main() -> None:
-    # Strict mode: FAIL if BTC data is missing (no dummy numbers)
-    ri = RiskAnalysisIntegration(strict_data=True)
-
-    # Refresh local BTC candles from Binance before analysis (keeps CSV up-to-date)
-    csv_path = Path("src/flare_ai_defai/crash_detection_system/data/btc_15m_data.csv")
-    df = pd.read_csv(csv_path)
-    df = update_latest(df)
-    df.to_csv(csv_path, index=False)
-
-    # Reload integration so it uses the refreshed file (simple + safe)
-    ri = RiskAnalysisIntegration(strict_data=True)
-
-
-    # Live price from Flare (FTSOv2), fallback to CSV close for demo resilience
+def refresh_store(store: Path) -> None:
+    """
+    Refresh local BTC candles from Binance (keeps the store up-to-date).
+    """
+    if not store.exists():
+        # One-shot migration from the legacy CSV store
+        legacy = pd.read_csv(
+            store.with_suffix(".csv"),
+            usecols=list(KLINE_DTYPES),
+            dtype=KLINE_DTYPES,
+            parse_dates=False,
+            engine="c",
+            memory_map=True,
+        )
+        write_candles(store, legacy)
+
+    # Append-only: Binance returns sorted rows after the +1 ms seek, so only
+    # the new candles are written - no concat/dedupe over the full history.
+    # Pages until caught up, so a long gap since the last run is filled too.
+    update_store(store)
+
+
+def _integration() -> RiskAnalysisIntegration:
+    # Strict mode: FAIL if BTC data is missing (no dummy numbers).
+    # This script refreshes the integration itself after each store update,
+    # so the background refresher stays off.
+    return RiskAnalysisIntegration(strict_data=True, refresh_seconds=0)
+
+
+def build_snapshot(ri: RiskAnalysisIntegration) -> None:
+    """
+    Analyze the integration's current data and write the snapshot JSON.
+    """
+    # Live price from Flare (FTSOv2), fallback to the last stored close for
+    # demo resilience
     try:
         flare_px = get_btc_usd_price()
         current_price = float(flare_px.price)
@@ -66,18 +118,13 @@ def main() -> None:
         price_timestamp = flare_px.timestamp
     except Exception:
         current_price = float(ri.data["close"].iloc[-1])
-        price_source = "btc_15m_data.csv"
+        price_source = "binance-15m-store"
         price_timestamp = None
 
-
-    # Deterministic demo defaults
-    horizon_hours = 24
-    #risk_profile = RiskAppetite.MEDIUM
-
     # Run deterministic risk analysis
     result = ri.analyze_for_snapshot(
-        risk_appetite=risk_profile,
-        horizon_hours=horizon_hours,
+        risk_appetite=RISK_PROFILE,
+        horizon_hours=HORIZON_HOURS,
     )
 
     snapshot = {
@@ -88,17 +135,61 @@ def main() -> None:
         "price_timestamp": price_timestamp,  # oracle timestamp
         "risk": ri.to_snapshot_dict(
         result,
-        risk_profile,
-        horizon_hours,
+        RISK_PROFILE,
+        HORIZON_HOURS,
         ),
     }
 
+    atomic_write_json(SNAPSHOT_PATH, snapshot)
+    logger.info("snapshot_written", path=str(SNAPSHOT_PATH.resolve()))
 
-    out_path = Path("shared/latest_update.json")
-    atomic_write_json(out_path, snapshot)
 
-    print("✔ Wrote BTC snapshot to", out_path.resolve())
+def main() -> None:
+    refresh_store(STORE)
+    # Build the integration only after the refresh so it loads the new candles.
+    ri = _integration()
+    try:
+        build_snapshot(ri)
+    finally:
+        ri.close()
+
+
+def loop() -> None:
+    """
+    Rebuild the snapshot after every candle close in this process, keeping
+    pandas/numpy and one warm integration (data cache, fitted models) across
+    ticks.
+    """
+    ri = None
+    try:
+        while True:
+            try:
+                refresh_store(STORE)
+                if ri is None:
+                    ri = _integration()
+                else:
+                    # Reloads the store if it changed and warms every profile
+                    # off the fitted models; the analyze below then hits the
+                    # result cache
+                    ri.refresh(HORIZON_HOURS)
+                build_snapshot(ri)
+            except TICK_ERRORS:
+                # Keep the producer alive; the next tick retries
+                logger.exception("snapshot_build_failed")
+            time.sleep(_seconds_to_next_15m())
+    finally:
+        if ri is not None:
+            ri.close()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="run forever, rebuilding at every 15m candle close",
+    )
+    if parser.parse_args().loop:
+        loop()
+    else:
+        main()
@@ -4,11 +4,20 @@ PATCH FOR chat.py
 Add these imports at the top:
 """
 
+import re
+
 from flare_ai_defai.crash_detection_system.integration import (
     RiskAnalysisIntegration,
     parse_user_intent_with_llm
 )
 
+"""
+And this module-level pattern (one case-insensitive scan instead of a
+substring search per keyword):
+"""
+
+_RISK_RE = re.compile(r"risk|crash|exposure|btc|position|volatility", re.IGNORECASE)
+
 """
 Then add this method to ChatRouter class:
 """
@@ -55,8 +64,7 @@ def handle_conversation(self, user_message: str, **kwargs) -> str:
     """Route to risk analysis if message contains risk keywords"""
     
     # Check if this is a risk analysis request
-    risk_keywords = ['risk', 'crash', 'exposure', 'btc', 'position', 'volatility']
-    if any(keyword in user_message.lower() for keyword in risk_keywords):
+    if _RISK_RE.search(user_message):
         return self.handle_risk_analysis(user_message)
     
     # Otherwise, proceed with normal chat flow
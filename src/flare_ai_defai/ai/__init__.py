@@ -5,6 +5,7 @@ from .base import (
     GenerationConfig,
     ModelResponse,
 )
+from .cache import LLMCache, SemanticCache
 from .gemini import GeminiProvider
 from .openrouter import AsyncOpenRouterProvider, OpenRouterProvider
 
@@ -15,6 +16,8 @@ __all__ = [
     "CompletionRequest",
     "GeminiProvider",
     "GenerationConfig",
+    "LLMCache",
     "ModelResponse",
     "OpenRouterProvider",
+    "SemanticCache",
 ]
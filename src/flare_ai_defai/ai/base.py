@@ -72,6 +72,7 @@ class BaseAIProvider(ABC):
         prompt: str,
         response_mime_type: str | None = None,
         response_schema: Any | None = None,
+        temperature: float | None = None,
     ) -> ModelResponse:
         """Generate a response without maintaining conversation context
 
@@ -80,6 +81,7 @@ class BaseAIProvider(ABC):
             response_mime_type: Expected response format
                 (e.g., "text/plain", "application/json")
             response_schema: Expected response structure schema
+            temperature: Sampling temperature; None uses the model default
 
         Returns:
             ModelResponse containing the generated text and metadata
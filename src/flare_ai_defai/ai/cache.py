@@ -0,0 +1,107 @@
+"""
+Response caches for LLM calls.
+
+LLMCache is an exact-match cache: prompts rendered from the same template
+with the same arguments (semantic routing, account generation, tx
+confirmation) and generated at temperature 0 produce the same answer, so
+repeated calls can be served without a model round-trip.
+
+SemanticCache matches by embedding similarity instead, so differently
+phrased messages with the same intent can share a classification.
+"""
+
+import hashlib
+import json
+from collections import deque
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+from cachetools import TTLCache
+
+from flare_ai_defai.ai.base import ModelResponse
+
+
+class LLMCache:
+    """
+    TTL-bounded cache of ModelResponse objects keyed by prompt and config.
+
+    Attributes:
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups that required a model call
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600) -> None:
+        self._entries: TTLCache[str, ModelResponse] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        prompt: str,
+        mime_type: str | None,
+        schema: Any | None,
+        temperature: float | None,
+    ) -> str:
+        """Stable SHA256 key for a prompt and its generation config."""
+        payload = json.dumps(
+            {"p": prompt, "m": mime_type, "s": str(schema), "t": temperature},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> ModelResponse | None:
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def put(self, key: str, response: ModelResponse) -> None:
+        self._entries[key] = response
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+T = TypeVar("T")
+
+
+class SemanticCache(Generic[T]):
+    """
+    Bounded nearest-neighbour cache over unit-norm embeddings.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a hit
+        hits (int): Number of lookups served from the cache
+        misses (int): Number of lookups below the threshold
+    """
+
+    def __init__(self, maxsize: int = 512, threshold: float = 0.92) -> None:
+        self._entries: deque[tuple[np.ndarray, T]] = deque(maxlen=maxsize)
+        self._matrix: np.ndarray | None = None
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, emb: np.ndarray) -> T | None:
+        if self._entries:
+            if self._matrix is None:
+                self._matrix = np.stack([e for e, _ in self._entries])
+            sims = self._matrix @ emb
+            best = int(np.argmax(sims))
+            if sims[best] > self.threshold:
+                self.hits += 1
+                return self._entries[best][1]
+        self.misses += 1
+        return None
+
+    def put(self, emb: np.ndarray, value: T) -> None:
+        self._entries.append((emb, value))
+        self._matrix = None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._matrix = None
@@ -15,5 +15,6 @@ class DummyAIProvider:
         prompt: str,
         response_mime_type: str | None = None,
         response_schema: dict | None = None,
+        temperature: float | None = None,
     ):
         return DummyResponse("[SIMULATED AI RESPONSE]")
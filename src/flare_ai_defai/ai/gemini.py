@@ -6,13 +6,19 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+import functools
 import json
+import logging
+import threading
+from collections import deque
 from typing import Any, override
 
 import google.generativeai as genai
+import numpy as np
 import structlog
+from google.api_core import exceptions as google_exceptions
 from google.generativeai.types import ContentDict, GenerationConfig
-from flare_ai_defai.settings import settings
+from flare_ai_defai.settings import get_settings
 from flare_ai_defai.ai.base import (
     BaseAIProvider,
     ModelResponse,
@@ -21,6 +27,18 @@ from flare_ai_defai.ai.base import (
 
 logger = structlog.get_logger(__name__)
 
+# Gemini errors worth retrying: rate limiting (429) and server-side 5xx
+TRANSIENT_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+)
+
+# Bound on turns kept (and re-sent upstream); even, so trimming keeps
+# user/model pairs
+MAX_CHAT_HISTORY = 64
+
 
 SYSTEM_INSTRUCTION = """
 You are Artemis, an AI assistant specialized in helping users navigate
@@ -53,6 +71,60 @@ more engaging - your goal is to be helpful first, entertaining second.
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _build_model(
+    api_key: str,  # noqa: ARG001 - part of the cache key, see genai.configure
+    model: str,
+    system_instruction: str,
+) -> genai.GenerativeModel:  # pyright: ignore [reportPrivateImportUsage]
+    """
+    Build (once per api_key/model/instruction) the configured Gemini model.
+
+    Providers created with the same configuration share one model object
+    instead of rebuilding it and its system prompt on every init.
+    """
+    return genai.GenerativeModel(  # pyright: ignore [reportPrivateImportUsage]
+        model_name=model,
+        system_instruction=system_instruction,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_generation_config(
+    response_mime_type: str | None,
+    response_schema: Any | None,
+    temperature: float | None,
+) -> GenerationConfig:
+    return GenerationConfig(
+        response_mime_type=response_mime_type,
+        response_schema=response_schema,
+        temperature=temperature,
+    )
+
+
+def _generation_config(
+    response_mime_type: str | None,
+    response_schema: Any | None,
+    temperature: float | None = None,
+) -> GenerationConfig:
+    """
+    Reuse one GenerationConfig per (mime type, schema, temperature).
+
+    Prompt schemas are classes (TypedDict/Enum) and hash by identity;
+    unhashable, truly dynamic schemas fall back to per-call construction.
+    """
+    try:
+        return _cached_generation_config(
+            response_mime_type, response_schema, temperature
+        )
+    except TypeError:
+        return GenerationConfig(
+            response_mime_type=response_mime_type,
+            response_schema=response_schema,
+            temperature=temperature,
+        )
+
+
 class GeminiProvider(BaseAIProvider):
     """
     Provider class for Google's Gemini AI service.
@@ -64,7 +136,8 @@ class GeminiProvider(BaseAIProvider):
     Attributes:
         chat (genai.ChatSession | None): Active chat session
         model (genai.GenerativeModel): Configured Gemini model instance
-        chat_history (list[ContentDict]): History of chat interactions
+        chat_history (deque[ContentDict]): Bounded history of chat interactions
+        chat_lock (threading.Lock): Serializes use of the shared chat session
         logger (BoundLogger): Structured logger for the provider
     """
 
@@ -80,13 +153,18 @@ class GeminiProvider(BaseAIProvider):
         """
         genai.configure(api_key=api_key)  # pyright: ignore [reportPrivateImportUsage]
         self.chat: genai.ChatSession | None = None  # pyright: ignore [reportPrivateImportUsage]
-        self.model = genai.GenerativeModel(  # pyright: ignore [reportPrivateImportUsage]
-            model_name=model,
-            system_instruction=kwargs.get("system_instruction", SYSTEM_INSTRUCTION),
+        self.model = _build_model(
+            api_key,
+            model,
+            kwargs.get("system_instruction", SYSTEM_INSTRUCTION),
+        )
+        self.chat_history: deque[ContentDict] = deque(
+            [ContentDict(parts=["Hi, I'm Artemis"], role="model")],
+            maxlen=MAX_CHAT_HISTORY,
         )
-        self.chat_history: list[ContentDict] = [
-            ContentDict(parts=["Hi, I'm Artemis"], role="model")
-        ]
+        # send_message runs in worker threads; one session must not be
+        # advanced or trimmed by two requests at once
+        self.chat_lock = threading.Lock()
         self.logger = logger.bind(service="gemini")
 
     @override
@@ -96,11 +174,11 @@ class GeminiProvider(BaseAIProvider):
 
         Clears chat history and terminates active chat session.
         """
-        self.chat_history = []
-        self.chat = None
-        self.logger.debug(
-            "reset_gemini", chat=self.chat, chat_history=self.chat_history
-        )
+        with self.chat_lock:
+            self.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
+            self.chat = None
+        if self.logger.is_enabled_for(logging.DEBUG):
+            self.logger.debug("reset_gemini", chat_history_len=len(self.chat_history))
 
     @override
     def generate(
@@ -108,6 +186,7 @@ class GeminiProvider(BaseAIProvider):
         prompt: str,
         response_mime_type: str | None = None,
         response_schema: Any | None = None,
+        temperature: float | None = None,
     ) -> ModelResponse:
         """
         Generate content using the Gemini model.
@@ -116,6 +195,8 @@ class GeminiProvider(BaseAIProvider):
             prompt (str): Input prompt for content generation
             response_mime_type (str | None): Expected MIME type for the response
             response_schema (Any | None): Schema defining the response structure
+            temperature (float | None): Sampling temperature; None keeps the
+                model default
 
         Returns:
             ModelResponse: Generated content with metadata including:
@@ -125,8 +206,9 @@ class GeminiProvider(BaseAIProvider):
                     - candidate_count: Number of generated candidates
                     - prompt_feedback: Feedback on the input prompt
         """
-        if settings.simulate_ai:
-            self.logger.debug("simulate_ai_generate", prompt=prompt)
+        if get_settings().simulate_ai:
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug("simulate_ai_generate", prompt=prompt)
             return ModelResponse(
                 text=json.dumps({"simulated": True, "prompt": prompt[:80]}),
                 raw_response=None,
@@ -135,9 +217,8 @@ class GeminiProvider(BaseAIProvider):
 
         response = self.model.generate_content(
             prompt,
-            generation_config=GenerationConfig(
-                response_mime_type=response_mime_type,
-                response_schema=response_schema,
+            generation_config=_generation_config(
+                response_mime_type, response_schema, temperature
             ),
         )
 
@@ -151,11 +232,33 @@ class GeminiProvider(BaseAIProvider):
         )
 
 
+    def embed(self, text: str) -> np.ndarray | None:
+        """
+        Embed text for semantic similarity lookups.
+
+        Args:
+            text (str): Text to embed
+
+        Returns:
+            np.ndarray | None: Unit-norm float32 embedding, or None in
+                simulate mode
+        """
+        if get_settings().simulate_ai:
+            return None
+        result = genai.embed_content(  # pyright: ignore [reportPrivateImportUsage]
+            model=get_settings().gemini_embedding_model,
+            content=text,
+            task_type="SEMANTIC_SIMILARITY",
+        )
+        emb = np.asarray(result["embedding"], dtype=np.float32)
+        return emb / np.linalg.norm(emb)
+
     @override
     def send_message(self, msg: str) -> ModelResponse:
         # 🔹 DEV MODE: simulate AI
-        if settings.simulate_ai:
-            self.logger.debug("simulate_ai_response", message=msg)
+        if get_settings().simulate_ai:
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug("simulate_ai_response", message=msg)
             return ModelResponse(
                 text=f"[SIMULATED ARTEMIS] I received: '{msg}'",
                 raw_response=None,
@@ -163,10 +266,17 @@ class GeminiProvider(BaseAIProvider):
             )
 
         # 🔹 REAL MODE: Gemini
-        if not self.chat:
-            self.chat = self.model.start_chat(history=self.chat_history)
+        with self.chat_lock:
+            if not self.chat:
+                self.chat = self.model.start_chat(history=list(self.chat_history))
+
+            response = self.chat.send_message(msg)
 
-        response = self.chat.send_message(msg)
+            # The session accumulates every turn and replays it on each
+            # request; keep only the most recent turns.
+            history = self.chat.history
+            if len(history) > MAX_CHAT_HISTORY:
+                self.chat.history = history[-MAX_CHAT_HISTORY:]
 
         return ModelResponse(
             text=response.text,
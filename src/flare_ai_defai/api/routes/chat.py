@@ -12,24 +12,29 @@ The module provides a ChatRouter class that integrates various services:
 - Risk Analysis through RiskEngine (NEW)
 """
 
-import json
+import asyncio
 import re
 
 
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 from web3 import Web3
 from web3.exceptions import Web3RPCError
 
-from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.ai import GeminiProvider, LLMCache, SemanticCache
+from flare_ai_defai.ai.gemini import TRANSIENT_ERRORS
 from flare_ai_defai.attestation import Vtpm, VtpmAttestationError
 from flare_ai_defai.blockchain import FlareProvider
+from flare_ai_defai.exceptions import CircuitOpenError
 from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
-from flare_ai_defai.settings import settings
+from flare_ai_defai.resilience import CircuitBreaker, Retry
+from flare_ai_defai.settings import get_settings
 
 # 🔹 NEW: Import risk analysis components
 from flare_ai_defai.crash_detection_system.integration import (
@@ -40,23 +45,60 @@ from flare_ai_defai.crash_detection_system.integration import (
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Case-insensitive substring triggers, scanned in one pass without a lower() copy
+_ANALYSIS_RE = re.compile(
+    "|".join(
+        [
+            "snapshot",
+            "summaris",  # summarize / summarise
+            "analy",  # analyze / analysis
+            "risk",
+            "entropy",
+            "kl",
+            "what to watch",
+            "state",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Same substring semantics as the analysis triggers ("volatil" covers both
+# volatile and volatility)
+_RISK_RE = re.compile(
+    "|".join(
+        [
+            "risk",
+            "crash",
+            "exposure",
+            "volatil",
+            "btc",
+            "bitcoin",
+            "position",
+            "hedge",
+            "drawdown",
+            "liquidation",
+            "var",
+            "downside",
+            "portfolio",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+_BRACED_JSON_RE = re.compile(r"(\{.*\})", re.S)
+
+# Cached generations use greedy decoding, so a stored response is the
+# response the model would give again, not one sample of many
+_CACHED_TEMPERATURE = 0.0
+
+
 def wants_analysis(message: str) -> bool:
     """
     Only enter structured snapshot analysis when explicitly requested.
     Default is normal chat.
     """
-    msg = message.lower()
-    triggers = [
-        "snapshot",
-        "summaris",   # summarize / summarise
-        "analy",      # analyze / analysis
-        "risk",
-        "entropy",
-        "kl",
-        "what to watch",
-        "state",
-    ]
-    return any(t in msg for t in triggers)
+    return _ANALYSIS_RE.search(message) is not None
 
 
 def coerce_json(text: str) -> dict[str, Any]:
@@ -69,24 +111,65 @@ def coerce_json(text: str) -> dict[str, Any]:
     t = text.strip()
 
     # unwrap fenced code block
-    m = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", t, flags=re.S)
+    m = _FENCED_JSON_RE.search(t)
     if m:
         t = m.group(1).strip()
 
     # best-effort: extract first {...}
     if not (t.startswith("{") and t.endswith("}")):
-        m2 = re.search(r"(\{.*\})", t, flags=re.S)
+        m2 = _BRACED_JSON_RE.search(t)
         if m2:
             t = m2.group(1).strip()
 
-    return json.loads(t)
+    return orjson.loads(t)
+
+
+_SNAPSHOT_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
 
 def load_snapshot() -> dict[str, Any] | None:
-    p = Path(settings.latest_update_path).resolve()
-    if not p.exists():
+    """
+    Read the latest snapshot JSON, reparsing only when the file changes.
+
+    The parsed dict is cached per path and keyed by (mtime_ns, size).
+    """
+    p = Path(get_settings().latest_update_path).resolve()
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         return None
-    return json.loads(p.read_text(encoding="utf-8"))
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _SNAPSHOT_CACHE.get(p)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    snapshot = orjson.loads(p.read_bytes())
+    _SNAPSHOT_CACHE[p] = (stamp, snapshot)
+    return snapshot
+
+
+# Conversation prompt, split once around the optional snapshot block and the
+# trailing user message
+_CONVERSATION_HEAD, _CONVERSATION_TAIL = (
+    """
+        SYSTEM:
+        You are Artemis, a helpful assistant for a demo Flare DeFAI app.
+        You are NOT a financial advisor.
+        Do not provide personalized financial advice.
+        Do NOT tell the user to buy/sell/hold or give trade instructions.
+        You MAY provide general, educational "things to consider".
+
+        INSTRUCTIONS:
+        - Answer in normal conversational text (no JSON).
+        - If snapshot values are provided and relevant, weave them naturally into the answer.
+        - Never invent missing values. If a field is null/missing, say "not provided".
+
+        {snapshot}
+
+        USER:
+        {user}
+        """.strip().removesuffix("{user}").split("{snapshot}")
+)
+_CONVERSATION_PROMPT = _CONVERSATION_HEAD + _CONVERSATION_TAIL
 
 
 class ChatMessage(BaseModel):
@@ -97,7 +180,22 @@ class ChatMessage(BaseModel):
         message (str): The chat message content, must not be empty
     """
 
-    message: str = Field(..., min_length=1)
+    # Length is checked by the core str validator; unknown keys are still
+    # ignored, as clients may send extra fields
+    model_config = ConfigDict(str_min_length=1)
+
+    message: str
+
+
+class ChatResponse(BaseModel):
+    """
+    Response body of the chat endpoint.
+
+    Attributes:
+        response (str): Text shown to the user
+    """
+
+    response: str
 
 
 class ChatRouter:
@@ -139,6 +237,14 @@ class ChatRouter:
         self.attestation = attestation
         self.prompts = prompts
         self.logger = logger.bind(router="chat")
+        self._llm_cache = LLMCache()
+        self._route_cache: SemanticCache[SemanticRouterResponse] = SemanticCache()
+        # Fail fast while Gemini or the RPC is down instead of blocking a
+        # worker thread per request; tx reverts are not RPC outages
+        self._ai_cb = CircuitBreaker("gemini")
+        self._rpc_cb = CircuitBreaker("flare_rpc", exclude=(Web3RPCError,))
+        # Stateless generate calls are idempotent and safe to re-issue
+        self._ai_retry = Retry(TRANSIENT_ERRORS)
         
         # 🔹 NEW: Initialize risk analysis integration
         #try:
@@ -164,8 +270,8 @@ class ChatRouter:
         Handles message routing, command processing, and transaction confirmations.
         """
 
-        @self._router.post("/")
-        async def chat(message: ChatMessage): # -> dict[str, Any]:  # pyright: ignore [reportUnusedFunction]
+        @self._router.post("/", response_model=ChatResponse)
+        async def chat(message: ChatMessage):  # pyright: ignore [reportUnusedFunction]
             """
             Process incoming chat messages and route them to appropriate handlers.
 
@@ -188,7 +294,9 @@ class ChatRouter:
                     and message.message == self.blockchain.tx_queue[-1].msg
                 ):
                     try:
-                        tx_hash = self.blockchain.send_tx_in_queue()
+                        tx_hash = await self._rpc_cb.call(
+                            asyncio.to_thread, self.blockchain.send_tx_in_queue
+                        )
                     except Web3RPCError as e:
                         self.logger.exception("send_tx_failed", error=str(e))
                         msg = (
@@ -199,17 +307,17 @@ class ChatRouter:
                     prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                         "tx_confirmation",
                         tx_hash=tx_hash,
-                        block_explorer=settings.web3_explorer_url,
+                        block_explorer=get_settings().web3_explorer_url,
                     )
-                    tx_confirmation_response = self.ai.generate(
-                        prompt=prompt,
-                        response_mime_type=mime_type,
-                        response_schema=schema,
+                    tx_confirmation_response = await self._cached_generate(
+                        prompt, mime_type, schema
                     )
                     return {"response": tx_confirmation_response.text}
                 if self.attestation.attestation_requested:
                     try:
-                        resp = self.attestation.get_token([message.message])
+                        resp = await asyncio.to_thread(
+                            self.attestation.get_token, [message.message]
+                        )
                     except VtpmAttestationError as e:
                         resp = f"The attestation failed with  error:\n{e.args[0]}"
                     self.attestation.attestation_requested = False
@@ -219,12 +327,20 @@ class ChatRouter:
                 #
 
                 # 🔹 NEW: Check if this is a risk analysis request BEFORE semantic routing
+                # (keyword match, no LLM) so a message costs one model call:
+                # intent extraction for risk queries, the router otherwise.
                 if self._is_risk_query(message.message):
                     return await self.handle_risk_analysis(message.message)
 
                 route = await self.get_semantic_route(message.message)
                 return await self.route_message(route, message.message)
 
+            except CircuitOpenError as e:
+                self.logger.warning("circuit_open", error=str(e))
+                return {
+                    "response": "Service temporarily unavailable, "
+                    "please retry shortly."
+                }
             except Exception as e:
                 self.logger.exception("message_handling_failed", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e)) from e
@@ -234,6 +350,85 @@ class ChatRouter:
         """Get the FastAPI router with registered routes."""
         return self._router
 
+    async def _ai_generate(self, **kwargs: Any) -> Any:
+        """
+        Run the blocking ai.generate call in a worker thread.
+
+        Keeps the event loop free to serve other requests during the LLM
+        round-trip. Transient Gemini errors are retried with backoff; only
+        the final outcome counts towards the circuit breaker.
+        """
+        return await self._ai_cb.call(
+            self._ai_retry.call, asyncio.to_thread, self.ai.generate, **kwargs
+        )
+
+    async def _cached_generate(
+        self, prompt: str, mime_type: str | None, schema: Any | None
+    ) -> Any:
+        """
+        ai.generate at temperature 0 with an exact-match cache.
+
+        Greedy decoding makes the response a function of the prompt and
+        config, so identical calls reuse the earlier response instead of
+        making another model round-trip.
+        """
+        key, cached = self._llm_cache_lookup(prompt, mime_type, schema)
+        if cached is not None:
+            return cached
+        return await self._generate_into_cache(key, prompt, mime_type, schema)
+
+    def _llm_cache_lookup(
+        self, prompt: str, mime_type: str | None, schema: Any | None
+    ) -> tuple[str, Any | None]:
+        """Exact LLMCache key for a temperature-0 call and its cached response."""
+        key = self._llm_cache.key(prompt, mime_type, schema, _CACHED_TEMPERATURE)
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self.logger.debug(
+                "llm_cache_hit",
+                hits=self._llm_cache.hits,
+                misses=self._llm_cache.misses,
+            )
+        return key, cached
+
+    async def _generate_into_cache(
+        self, key: str, prompt: str, mime_type: str | None, schema: Any | None
+    ) -> Any:
+        """Generate at temperature 0 and store the response under key."""
+        response = await self._ai_generate(
+            prompt=prompt,
+            response_mime_type=mime_type,
+            response_schema=schema,
+            temperature=_CACHED_TEMPERATURE,
+        )
+        self._llm_cache.put(key, response)
+        return response
+
+    async def _embed(self, message: str) -> np.ndarray | None:
+        """
+        Embed a message for the semantic route cache.
+
+        Runs behind the same retry and circuit breaker as generate. Returns
+        None when the provider has no embedding support or the embedding
+        call fails; routing then falls through to the LLM.
+        """
+        embed = getattr(self.ai, "embed", None)
+        if embed is None:
+            return None
+        try:
+            return await self._ai_cb.call(
+                self._ai_retry.call, asyncio.to_thread, embed, message
+            )
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self.logger.warning("embedding_failed", error=str(e))
+            return None
+
+    async def _ai_send_message(self, msg: str) -> Any:
+        """Run the blocking ai.send_message call in a worker thread."""
+        return await self._ai_cb.call(asyncio.to_thread, self.ai.send_message, msg)
+
     # 🔹 NEW: Risk query detection
     def _is_risk_query(self, message: str) -> bool:
         """
@@ -245,14 +440,7 @@ class ChatRouter:
         Returns:
             True if risk-related query
         """
-        risk_keywords = [
-            'risk', 'crash', 'exposure', 'volatile', 'volatility',
-            'btc', 'bitcoin', 'position', 'hedge', 'drawdown',
-            'liquidation', 'var', 'downside', 'portfolio'
-        ]
-        
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in risk_keywords)
+        return _RISK_RE.search(message) is not None
 
     # 🔹 NEW: Risk analysis handler
     async def handle_risk_analysis(self, message: str) -> dict[str, str]:
@@ -281,7 +469,9 @@ class ChatRouter:
             self.logger.info("risk_analysis_requested", message=message)
             
             # Step 1: LLM ONLY extracts user preferences (NO MATH)
-            intent = parse_user_intent_with_llm(self.ai, message)
+            intent = await self._ai_cb.call(
+                asyncio.to_thread, parse_user_intent_with_llm, self.ai, message
+            )
             
             self.logger.debug(
                 "parsed_intent",
@@ -291,9 +481,9 @@ class ChatRouter:
             )
             
             # Step 2: DETERMINISTIC risk analysis (ALL MATH HERE, NO LLM)
-            result = self.risk_integration.analyze(intent)
+            result = await asyncio.to_thread(self.risk_integration.analyze, intent)
             
-            snapshot = load_snapshot()
+            snapshot = await asyncio.to_thread(load_snapshot)
             if snapshot and snapshot.get("price") is not None:
                 result.current_price = float(snapshot["price"])
 
@@ -310,6 +500,8 @@ class ChatRouter:
             
             return {"response": response}
             
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.exception("risk_analysis_failed", error=str(e))
             return {
@@ -344,13 +536,36 @@ class ChatRouter:
             SemanticRouterResponse: Determined route for the message
         """
         try:
+            # Exact repeats are answered from the LLM cache without paying
+            # the embedding round-trip; only a miss is embedded
             prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                 "semantic_router", user_input=message
             )
-            route_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            key, cached = self._llm_cache_lookup(prompt, mime_type, schema)
+            if cached is not None:
+                return SemanticRouterResponse(cached.text)
+
+            emb = await self._embed(message)
+            if emb is not None:
+                cached_route = self._route_cache.get(emb)
+                if cached_route is not None:
+                    self.logger.debug(
+                        "route_cache_hit",
+                        route=cached_route,
+                        hits=self._route_cache.hits,
+                        misses=self._route_cache.misses,
+                    )
+                    return cached_route
+
+            route_response = await self._generate_into_cache(
+                key, prompt, mime_type, schema
             )
-            return SemanticRouterResponse(route_response.text)
+            route = SemanticRouterResponse(route_response.text)
+            if emb is not None:
+                self._route_cache.put(emb, route)
+            return route
+        except CircuitOpenError:
+            raise
         except Exception as e:
             self.logger.exception("routing_failed", error=str(e))
             return SemanticRouterResponse.CONVERSATIONAL
@@ -399,9 +614,7 @@ class ChatRouter:
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
             "generate_account", address=address
         )
-        gen_address_response = self.ai.generate(
-            prompt=prompt, response_mime_type=mime_type, response_schema=schema
-        )
+        gen_address_response = await self._cached_generate(prompt, mime_type, schema)
         return {"response": gen_address_response.text}
 
     async def handle_send_token(self, message: str) -> dict[str, str]:
@@ -420,20 +633,21 @@ class ChatRouter:
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
             "token_send", user_input=message
         )
-        send_token_response = self.ai.generate(
+        send_token_response = await self._ai_generate(
             prompt=prompt, response_mime_type=mime_type, response_schema=schema
         )
-        send_token_json = json.loads(send_token_response.text)
+        send_token_json = orjson.loads(send_token_response.text)
         expected_json_len = 2
         if (
             len(send_token_json) != expected_json_len
             or send_token_json.get("amount") == 0.0
         ):
             prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
-            follow_up_response = self.ai.generate(prompt)
+            follow_up_response = await self._ai_generate(prompt=prompt)
             return {"response": follow_up_response.text}
 
-        tx = self.blockchain.create_send_flr_tx(
+        tx = await asyncio.to_thread(
+            self.blockchain.create_send_flr_tx,
             to_address=send_token_json.get("to_address"),
             amount=send_token_json.get("amount"),
         )
@@ -469,7 +683,7 @@ class ChatRouter:
         dict[str, str]: Response containing attestation request
         """
         prompt = self.prompts.get_formatted_prompt("request_attestation")[0]
-        request_attestation_response = self.ai.generate(prompt=prompt)
+        request_attestation_response = await self._ai_generate(prompt=prompt)
         self.attestation.attestation_requested = True
         return {"response": request_attestation_response.text}
 
@@ -478,33 +692,20 @@ class ChatRouter:
     async def handle_conversation(self, message: str) -> dict[str, Any]:
         use_snapshot = wants_analysis(message)  # you might rename this to wants_snapshot()
         
-        snapshot = load_snapshot() if use_snapshot else None
-        grounding_snapshot = (
-            f"\nSNAPSHOT_JSON (background context):\n{json.dumps(snapshot, indent=2)}\n"
-            if snapshot is not None
-            else ""
-        )
-
-        prompt = f"""
-        SYSTEM:
-        You are Artemis, a helpful assistant for a demo Flare DeFAI app.
-        You are NOT a financial advisor.
-        Do not provide personalized financial advice.
-        Do NOT tell the user to buy/sell/hold or give trade instructions.
-        You MAY provide general, educational "things to consider".
-
-        INSTRUCTIONS:
-        - Answer in normal conversational text (no JSON).
-        - If snapshot values are provided and relevant, weave them naturally into the answer.
-        - Never invent missing values. If a field is null/missing, say "not provided".
-
-        {grounding_snapshot}
-
-        USER:
-        {message}
-        """.strip()
+        snapshot = await asyncio.to_thread(load_snapshot) if use_snapshot else None
+        if snapshot is None:
+            prompt = _CONVERSATION_PROMPT + message.rstrip()
+        else:
+            grounding_snapshot = (
+                "\nSNAPSHOT_JSON (background context):\n"
+                f"{orjson.dumps(snapshot, option=orjson.OPT_INDENT_2).decode()}\n"
+            )
+            prompt = (
+                _CONVERSATION_HEAD + grounding_snapshot + _CONVERSATION_TAIL
+                + message.rstrip()
+            )
 
-        resp = self.ai.send_message(prompt)
+        resp = await self._ai_send_message(prompt)
         text = getattr(resp, "text", None)
         if not isinstance(text, str) or not text.strip():
                 return {"response": "Sorry, I got an unexpected response from the server."}
@@ -1,14 +1,15 @@
-import json
 from pathlib import Path
+
+import orjson
 from fastapi import APIRouter, HTTPException
 
-from flare_ai_defai.settings import settings
+from flare_ai_defai.settings import get_settings
 
 router = APIRouter()
 
 def _snapshot_path() -> Path:
     # settings.latest_update_path should be relative to repo root / container WORKDIR
-    return Path(settings.latest_update_path).resolve()
+    return Path(get_settings().latest_update_path).resolve()
 
 @router.get("/snapshot")
 def get_snapshot():
@@ -16,7 +17,7 @@ def get_snapshot():
     if not p.exists():
         raise HTTPException(status_code=404, detail=f"Missing snapshot file: {p}")
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
+        return orjson.loads(p.read_bytes())
+    except orjson.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"Invalid JSON in {p}: {e}") from e
 
@@ -0,0 +1,27 @@
+"""
+Numba kernels for the signal pipeline - PURE MATH, NO LLM.
+
+numba is optional: without it NUMBA_AVAILABLE is False and the signal
+classes keep using their pandas implementations.
+"""
+import warnings
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    warnings.warn("numba not installed - using pandas signal kernels", stacklevel=2)
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[..., Any]:
+        """No-op stand-in so kernel modules still import without numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
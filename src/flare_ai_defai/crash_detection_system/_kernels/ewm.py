@@ -0,0 +1,78 @@
+"""
+Exponentially weighted kernels over float64 arrays.
+
+Mirrors pandas' ewm(span=...).mean() with the defaults this package uses
+(adjust=True, ignore_na=False, min_periods=0), including the guard that
+keeps constant series exactly constant.
+"""
+import numpy as np
+
+from . import njit
+
+
+@njit(cache=True)
+def _decay(span: float) -> float:
+    """Weight kept by the old average per step, 1 - 1/(1 + com)."""
+    com = (span - 1) / 2.0
+    return 1.0 - 1.0 / (1.0 + com)
+
+
+@njit(cache=True)
+def _ewm_update(
+    weighted: float, old_wt: float, old_wt_factor: float, cur: float
+) -> tuple[float, float]:
+    """One adjust=True step; returns the new (weighted, old_wt)."""
+    if not np.isnan(weighted):
+        old_wt *= old_wt_factor
+        if not np.isnan(cur):
+            if weighted != cur:
+                weighted = old_wt * weighted + cur
+                weighted /= old_wt + 1.0
+            old_wt += 1.0
+    elif not np.isnan(cur):
+        weighted = cur
+    return weighted, old_wt
+
+
+@njit(cache=True)
+def ewm_mean(a: np.ndarray, span: float) -> np.ndarray:
+    """Equivalent to pd.Series(a).ewm(span=span).mean()."""
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    factor = _decay(span)
+    weighted = a[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        weighted, old_wt = _ewm_update(weighted, old_wt, factor, a[i])
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def dual_ema_ratio(
+    a: np.ndarray, fast_span: float, slow_span: float, k: float
+) -> np.ndarray:
+    """
+    (ewm(fast_span).mean() / ewm(slow_span).mean() - 1) * k in one pass,
+    both averages updated from the same read of a.
+    """
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    fast_factor = _decay(fast_span)
+    slow_factor = _decay(slow_span)
+    fast = a[0]
+    slow = a[0]
+    fast_wt = 1.0
+    slow_wt = 1.0
+    out[0] = (fast / slow - 1) * k
+    for i in range(1, n):
+        cur = a[i]
+        fast, fast_wt = _ewm_update(fast, fast_wt, fast_factor, cur)
+        slow, slow_wt = _ewm_update(slow, slow_wt, slow_factor, cur)
+        out[i] = (fast / slow - 1) * k
+    return out
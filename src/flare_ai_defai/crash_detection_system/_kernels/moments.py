@@ -0,0 +1,246 @@
+"""
+Streaming rolling moments: mean, skewness and excess kurtosis, plus the
+Amihud |r| / volume mean fused into a single pass.
+
+Power sums are updated by adding the entering sample and subtracting the
+leaving one, each with its own Kahan compensation, following pandas'
+roll_mean / roll_skew / roll_kurt so results match the pandas path. The
+rolling standard deviation lives in rolling.py.
+"""
+import numpy as np
+
+from . import njit
+
+# pandas' thresholds: below _VAR_EPS the window's variance is treated as
+# zero, and data is only re-centred when its minimum lies within
+# _CENTER_RANGE of the mean
+_VAR_EPS = 1e-14
+_CENTER_RANGE = 1e5
+_SKEW_ORDER = 3
+
+
+@njit(cache=True)
+def rolling_mean(a: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling mean; equivalent to pd.Series(a).rolling(...).mean()."""
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    nobs = 0
+    neg_ct = 0
+    sum_x = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    same_run = 0
+    prev_value = a[0] if n else 0.0
+    min_periods = max(min_periods, 1)
+    for i in range(n):
+        j = i - window
+        if j >= 0:
+            val = a[j]
+            if not np.isnan(val):
+                nobs -= 1
+                y = -val - comp_remove
+                t = sum_x + y
+                comp_remove = t - sum_x - y
+                sum_x = t
+                if np.signbit(val):
+                    neg_ct -= 1
+        val = a[i]
+        if not np.isnan(val):
+            nobs += 1
+            y = val - comp_add
+            t = sum_x + y
+            comp_add = t - sum_x - y
+            sum_x = t
+            if np.signbit(val):
+                neg_ct += 1
+            if val == prev_value:
+                same_run += 1
+            else:
+                same_run = 1
+            prev_value = val
+        if nobs >= min_periods:
+            result = sum_x / nobs
+            if same_run >= nobs:
+                result = prev_value
+            elif (neg_ct == 0 and result < 0) or (neg_ct == nobs and result > 0):
+                # all-positive (all-negative) windows cannot average below
+                # (above) zero; clip the rounding residue
+                result = 0.0
+            out[i] = result
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True, error_model="numpy")
+def rolling_amihud(
+    abs_returns: np.ndarray, volume: np.ndarray, window: int, min_periods: int
+) -> np.ndarray:
+    """
+    Rolling mean of |r| / volume without materialising the ratio.
+
+    Same arithmetic as rolling_mean(abs_returns / volume, ...): each ratio
+    is formed as it enters and again as it leaves the window. Zero volume
+    gives inf/nan exactly as the divided Series would.
+    """
+    n = abs_returns.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    nobs = 0
+    neg_ct = 0
+    sum_x = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    same_run = 0
+    prev_value = abs_returns[0] / volume[0] if n else 0.0
+    min_periods = max(min_periods, 1)
+    for i in range(n):
+        j = i - window
+        if j >= 0:
+            val = abs_returns[j] / volume[j]
+            if not np.isnan(val):
+                nobs -= 1
+                y = -val - comp_remove
+                t = sum_x + y
+                comp_remove = t - sum_x - y
+                sum_x = t
+                if np.signbit(val):
+                    neg_ct -= 1
+        val = abs_returns[i] / volume[i]
+        if not np.isnan(val):
+            nobs += 1
+            y = val - comp_add
+            t = sum_x + y
+            comp_add = t - sum_x - y
+            sum_x = t
+            if np.signbit(val):
+                neg_ct += 1
+            if val == prev_value:
+                same_run += 1
+            else:
+                same_run = 1
+            prev_value = val
+        if nobs >= min_periods:
+            result = sum_x / nobs
+            if same_run >= nobs:
+                result = prev_value
+            elif (neg_ct == 0 and result < 0) or (neg_ct == nobs and result > 0):
+                # all-positive (all-negative) windows cannot average below
+                # (above) zero; clip the rounding residue
+                result = 0.0
+            out[i] = result
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def _centered(a: np.ndarray) -> np.ndarray:
+    """Shift by the rounded mean (as pandas does) to keep power sums small."""
+    total = 0.0
+    count = 0
+    min_val = np.inf
+    for v in a:
+        if not np.isnan(v):
+            total += v
+            count += 1
+            min_val = min(min_val, v)
+    out = a.copy()
+    if count == 0:
+        return out
+    mean_val = total / count
+    if min_val - mean_val > -_CENTER_RANGE:
+        mean_val = np.sign(mean_val) * np.floor(np.abs(mean_val) + 0.5)
+        for i in range(out.shape[0]):
+            out[i] = out[i] - mean_val
+    return out
+
+
+@njit(cache=True)
+def _rolling_higher_moment(
+    a: np.ndarray, window: int, min_periods: int, order: int
+) -> np.ndarray:
+    """Shared add/remove sweep for skew (order 3) and kurtosis (order 4)."""
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    v = _centered(a)
+    nobs = 0
+    # power sums and their add/remove compensations, index = power - 1
+    s = np.zeros(4)
+    c_add = np.zeros(4)
+    c_rem = np.zeros(4)
+    same_run = 0
+    prev_value = a[0] if n else 0.0
+    min_periods = max(min_periods, order)
+    for i in range(n):
+        j = i - window
+        if j >= 0:
+            val = v[j]
+            if not np.isnan(val):
+                nobs -= 1
+                p = val
+                for k in range(order):
+                    y = -p - c_rem[k]
+                    t = s[k] + y
+                    c_rem[k] = t - s[k] - y
+                    s[k] = t
+                    p = p * val
+        val = v[i]
+        if not np.isnan(val):
+            nobs += 1
+            p = val
+            for k in range(order):
+                y = p - c_add[k]
+                t = s[k] + y
+                c_add[k] = t - s[k] - y
+                s[k] = t
+                p = p * val
+            if val == prev_value:
+                same_run += 1
+            else:
+                same_run = 1
+            prev_value = val
+
+        if nobs < min_periods:
+            out[i] = np.nan
+            continue
+        dn = float(nobs)
+        if order == _SKEW_ORDER:
+            mean = s[0] / dn
+            m2 = s[1] / dn - mean * mean
+            m3 = s[2] / dn - mean * mean * mean - 3 * mean * m2
+            if same_run >= nobs:
+                out[i] = 0.0
+            elif m2 <= _VAR_EPS:
+                out[i] = np.nan
+            else:
+                sd = np.sqrt(m2)
+                out[i] = (np.sqrt(dn * (dn - 1.0)) * m3) / ((dn - 2) * sd * sd * sd)
+        else:
+            if same_run >= nobs:
+                out[i] = -3.0
+                continue
+            mean = s[0] / dn
+            mean_pow = mean * mean
+            m2 = s[1] / dn - mean_pow
+            mean_pow = mean_pow * mean
+            m3 = s[2] / dn - mean_pow - 3 * mean * m2
+            mean_pow = mean_pow * mean
+            m4 = s[3] / dn - mean_pow - 6 * m2 * mean * mean - 4 * m3 * mean
+            if m2 <= _VAR_EPS:
+                out[i] = np.nan
+            else:
+                kurt = (dn * dn - 1.0) * m4 / (m2 * m2) - 3 * ((dn - 1.0) ** 2)
+                out[i] = kurt / ((dn - 2.0) * (dn - 3.0))
+    return out
+
+
+@njit(cache=True)
+def rolling_skew(a: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling sample skewness; equivalent to pandas rolling(...).skew()."""
+    return _rolling_higher_moment(a, window, min_periods, 3)
+
+
+@njit(cache=True)
+def rolling_kurt(a: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Rolling excess kurtosis; equivalent to pandas rolling(...).kurt()."""
+    return _rolling_higher_moment(a, window, min_periods, 4)
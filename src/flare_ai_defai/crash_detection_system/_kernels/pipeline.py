@@ -0,0 +1,139 @@
+"""
+Fused signal pipelines: one kernel call per signal family.
+
+Each function takes the raw arrays and window sizes, runs every rolling
+stage for its family back to back and returns the final columns, so the
+intermediates (rolling std, funding, drawdown, amihud) never round-trip
+through pandas. Shared intermediates are computed once: lcvi reuses the
+funding stress and drawdown velocity instead of rebuilding them.
+
+error_model="numpy" keeps scalar division by zero returning inf/nan as
+the pandas path does instead of raising.
+"""
+import numpy as np
+
+from . import njit
+from .ewm import dual_ema_ratio, ewm_mean
+from .moments import rolling_amihud, rolling_kurt, rolling_mean, rolling_skew
+from .rolling import drawdown, rolling_median, rolling_std
+
+
+@njit(cache=True, error_model="numpy")
+def volatility_signals(
+    returns: np.ndarray,
+    rv_window: int,
+    vr_short: int,
+    vr_long: int,
+    vov_lookback: int,
+    ann_factor: float,
+    with_vov: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns:
+        (realized_vol, vol_regime, vol_of_vol); vol_of_vol is empty
+        unless with_vov
+    """
+    n = returns.shape[0]
+    rv = rolling_std(returns, rv_window, rv_window)
+    rv_short = rolling_std(returns, vr_short, vr_short)
+    for i in range(n):
+        rv[i] *= ann_factor
+        rv_short[i] *= ann_factor
+
+    rv_long = ewm_mean(rv_short, vr_long)
+    regime = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        regime[i] = rv_short[i] / rv_long[i]
+
+    if not with_vov:
+        return rv, regime, np.empty(0, dtype=np.float64)
+    rv_24 = rolling_std(returns, 24, 24)
+    for i in range(n):
+        rv_24[i] *= ann_factor
+    vov_std = rolling_std(rv_24, vov_lookback, vov_lookback)
+    vov_mean = rolling_mean(rv_24, vov_lookback, vov_lookback)
+    vov = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        vov[i] = vov_std[i] / vov_mean[i]
+    return rv, regime, vov
+
+
+@njit(cache=True, error_model="numpy")
+def leverage_signals(
+    close: np.ndarray,
+    returns: np.ndarray,
+    fast_window: int,
+    slow_window: int,
+    stress_window: int,
+    dd_window: int,
+    ref_window: int,
+    ann_factor: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns:
+        (funding_proxy, funding_stress, drawdown, dd_velocity, lcvi)
+    """
+    n = close.shape[0]
+    funding = dual_ema_ratio(close, fast_window, slow_window, 365 * 24 / 8)
+    abs_funding = np.abs(funding)
+
+    median_abs = rolling_median(abs_funding, stress_window, stress_window)
+    stress = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        stress[i] = abs_funding[i] / median_abs[i]
+
+    dd = drawdown(close, dd_window)
+    dd_vel = np.zeros(n, dtype=np.float64)
+    for i in range(1, n):
+        prev = abs(dd[i - 1])
+        if prev > 0.0:
+            dd_vel[i] = abs(dd[i] - dd[i - 1]) / prev
+
+    vol = rolling_std(returns, 96, 96)
+    for i in range(n):
+        vol[i] *= ann_factor
+    vol_ref = rolling_median(vol, ref_window, ref_window)
+    lcvi = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        lcvi[i] = vol[i] / vol_ref[i] * (1 + stress[i]) * (1 + dd_vel[i])
+    return funding, stress, dd, dd_vel, lcvi
+
+
+@njit(cache=True, error_model="numpy")
+def microstructure_signals(
+    returns: np.ndarray,
+    abs_returns: np.ndarray,
+    volume: np.ndarray,
+    illiq_window: int,
+    ref_window: int,
+    tail_window: int,
+    with_illiq: bool = True,
+    with_tail: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns:
+        (illiquidity, illiquidity_ratio, tail_risk_asym); the first two are
+        empty unless with_illiq, the last unless with_tail
+    """
+    n = returns.shape[0]
+    amihud = np.empty(0, dtype=np.float64)
+    ratio = np.empty(0, dtype=np.float64)
+    tra = np.empty(0, dtype=np.float64)
+
+    if with_illiq:
+        amihud = rolling_amihud(abs_returns, volume, illiq_window, illiq_window)
+        amihud_ref = rolling_median(amihud, ref_window, ref_window)
+        ratio = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            ratio[i] = amihud[i] / amihud_ref[i]
+
+    if with_tail:
+        skew = rolling_skew(returns, tail_window, tail_window)
+        kurt = rolling_kurt(returns, tail_window, tail_window)
+        tra = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            excess = kurt[i] - 3
+            if excess < 0:
+                excess = 0.0
+            tra[i] = -skew[i] * np.sqrt(excess)
+    return amihud, ratio, tra
@@ -0,0 +1,37 @@
+"""
+Column-wise percentile rank of a (n, k) float64 matrix.
+
+Same result as DataFrame.rank(pct=True): ties share their average rank,
+NaNs stay NaN and every column is divided by its own non-NaN count.
+Columns are independent, so they are ranked in parallel.
+"""
+import numpy as np
+
+from . import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def rank_pct_cols(matrix: np.ndarray) -> np.ndarray:
+    n, k = matrix.shape
+    out = np.empty((n, k), dtype=np.float64)
+    for j in prange(k):
+        col = np.ascontiguousarray(matrix[:, j])
+        order = np.argsort(col)  # NaNs sort last
+        count = 0
+        for i in range(n):
+            if not np.isnan(col[i]):
+                count += 1
+        i = 0
+        while i < count:
+            v = col[order[i]]
+            end = i + 1
+            while end < count and col[order[end]] == v:
+                end += 1
+            # Ranks i+1 .. end share their mean
+            pct = (i + end + 1) / 2 / count
+            for t in range(i, end):
+                out[order[t], j] = pct
+            i = end
+        for t in range(count, n):
+            out[order[t], j] = np.nan
+    return out
@@ -0,0 +1,178 @@
+"""
+Rolling-window kernels over float64 arrays.
+
+These mirror pandas' fixed-window aggregations (same NaN handling, same
+min_periods semantics, same online update order), so switching a signal
+from pandas to a kernel does not move its values.
+
+fastmath is deliberately off: the Kahan compensation terms in the variance
+update are exactly the kind of expression fastmath reassociates away.
+"""
+import numpy as np
+
+from . import njit
+
+
+@njit(cache=True)
+def rolling_max(a: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    Rolling maximum via a monotonic deque of indices, O(n).
+
+    Equivalent to pd.Series(a).rolling(window, min_periods).max().
+    """
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    dq = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    nobs = 0
+    for i in range(n):
+        v = a[i]
+        if not np.isnan(v):
+            nobs += 1
+            while tail > head and a[dq[tail - 1]] <= v:
+                tail -= 1
+            dq[tail] = i
+            tail += 1
+        old = i - window
+        if old >= 0:
+            if not np.isnan(a[old]):
+                nobs -= 1
+            if tail > head and dq[head] == old:
+                head += 1
+        if nobs >= min_periods and tail > head:
+            out[i] = a[dq[head]]
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def drawdown(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    Drawdown from the rolling peak, (p - max) / max, min_periods=1.
+
+    The peak and the ratio are produced in the same pass.
+    """
+    rmax = rolling_max(prices, window, 1)
+    out = np.empty_like(rmax)
+    for i in range(prices.shape[0]):
+        out[i] = (prices[i] - rmax[i]) / rmax[i]
+    return out
+
+
+@njit(cache=True)
+def rolling_std(
+    a: np.ndarray, window: int, min_periods: int, ddof: int = 1
+) -> np.ndarray:
+    """
+    Rolling sample standard deviation, O(n).
+
+    Welford's online update with Kahan-compensated means: one sample is
+    added and one removed per step, as in pandas' roll_var. Runs of
+    identical values report exactly zero variance.
+    """
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    nobs = 0.0
+    mean_x = 0.0
+    ssqdm_x = 0.0
+    comp_add = 0.0
+    comp_remove = 0.0
+    same_run = 0
+    prev_value = a[0] if n else 0.0
+    min_periods = max(min_periods, 1)
+
+    for i in range(n):
+        # remove the sample leaving the window
+        j = i - window
+        if j >= 0:
+            val = a[j]
+            if not np.isnan(val):
+                nobs -= 1.0
+                if nobs:
+                    prev_mean = mean_x - comp_remove
+                    y = val - comp_remove
+                    t = y - mean_x
+                    comp_remove = t + mean_x - y
+                    mean_x = mean_x - t / nobs
+                    ssqdm_x = ssqdm_x - (val - prev_mean) * (val - mean_x)
+                else:
+                    mean_x = 0.0
+                    ssqdm_x = 0.0
+
+        # add the new sample
+        val = a[i]
+        if not np.isnan(val):
+            nobs += 1.0
+            if val == prev_value:
+                same_run += 1
+            else:
+                same_run = 1
+            prev_value = val
+            prev_mean = mean_x - comp_add
+            y = val - comp_add
+            t = y - mean_x
+            comp_add = t + mean_x - y
+            mean_x = mean_x + t / nobs
+            ssqdm_x = ssqdm_x + (val - prev_mean) * (val - mean_x)
+
+        if nobs >= min_periods and nobs > ddof:
+            if same_run >= nobs:
+                out[i] = 0.0
+            else:
+                var = ssqdm_x / (nobs - ddof)
+                out[i] = np.sqrt(var) if var > 0.0 else 0.0
+        else:
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def rolling_median(a: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    Rolling median over a sorted window buffer.
+
+    When a sample leaves and another enters, the new value takes the old
+    one's slot and is walked to its sorted position, so a step costs the
+    rank distance between the two rather than a re-sort. Even counts
+    average the two middle values, as pandas does.
+    """
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    buf = np.empty(window, dtype=np.float64)
+    nobs = 0
+    min_periods = max(min_periods, 1)
+    for i in range(n):
+        val = a[i]
+        old = a[i - window] if i >= window else np.nan
+        if not np.isnan(old) and not np.isnan(val):
+            # replace in place, then restore order
+            k = np.searchsorted(buf[:nobs], old)
+            while k + 1 < nobs and buf[k + 1] < val:
+                buf[k] = buf[k + 1]
+                k += 1
+            while k > 0 and buf[k - 1] > val:
+                buf[k] = buf[k - 1]
+                k -= 1
+            buf[k] = val
+        elif not np.isnan(old):
+            k = np.searchsorted(buf[:nobs], old)
+            for m in range(k, nobs - 1):
+                buf[m] = buf[m + 1]
+            nobs -= 1
+        elif not np.isnan(val):
+            k = np.searchsorted(buf[:nobs], val)
+            for m in range(nobs, k, -1):
+                buf[m] = buf[m - 1]
+            buf[k] = val
+            nobs += 1
+        if nobs >= min_periods:
+            mid = nobs // 2
+            if nobs % 2:
+                out[i] = buf[mid]
+            else:
+                out[i] = (buf[mid] + buf[mid - 1]) / 2
+        else:
+            out[i] = np.nan
+    return out
@@ -2,14 +2,19 @@
 Risk Engine - Orchestrates all models and signals.
 PURE MATH, NO LLM.
 """
+import copy
+import dataclasses
+import functools
+import hashlib
+import time
 import pandas as pd
 import numpy as np
 import yaml
+from cachetools import LRUCache, TTLCache
 from pathlib import Path
-from datetime import datetime
 from typing import Dict
 
-from ..types import RiskProfile, RiskAnalysisResult
+from ..types import MarketArrays, RiskProfile, RiskAnalysisResult
 from ..signals.volatility import VolatilitySignals
 from ..signals.leverage import LeverageSignals
 from ..signals.microstructure import MicrostructureSignals
@@ -17,6 +22,20 @@ from ..models.regime_hmm import RegimeHMM
 from ..models.evt import ExtremeValueModel
 from ..models.crash_probability import CrashProbabilityModel
 
+# libyaml C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Signal columns read directly into RiskAnalysisResult / exposure logic
+_RESULT_SIGNALS = frozenset({'realized_vol', 'vol_regime', 'lcvi'})
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(path: str) -> Dict:
+    """Parse parameters.yaml once per resolved path."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
 
 class RiskEngine:
     """
@@ -39,8 +58,7 @@ class RiskEngine:
         if config_path is None:
             config_path = Path(__file__).parent.parent / "config" / "parameters.yaml"
         
-        with open(config_path) as f:
-            self.config = yaml.safe_load(f)
+        self.config = _load_config(str(Path(config_path).resolve()))
         
         # Initialize signal calculators
         self.vol_signals = VolatilitySignals(self.config['signals']['volatility'])
@@ -50,6 +68,48 @@ class RiskEngine:
         # Initialize models
         self.regime_model = RegimeHMM(self.config['models']['regime_hmm'])
         self.evt_model = ExtremeValueModel(self.config['models']['evt'])
+        
+        # New bars scored with the existing HMM fit before it is refitted
+        self._refit_every_bars = self.config['models']['regime_hmm'].get(
+            'refit_every_bars', 0
+        )
+        
+        # Exposure thresholds (read once, used on every evaluation)
+        self._lcvi_critical = self.config['thresholds']['lcvi_critical']
+        self._lcvi_warning = self.config['thresholds']['lcvi_warning']
+        
+        # Signal frames keyed by the close/volume data they were computed on
+        self._signal_cache: LRUCache = LRUCache(maxsize=8)
+        
+        # Fitted models + their predictions, keyed by the returns they saw
+        self._fit_cache: LRUCache = LRUCache(maxsize=8)
+        
+        # Finished results per (profile, horizon, last bar); bars tick every
+        # 15 min, so repeated in-bar queries are answered without recompute
+        self._result_cache: TTLCache = TTLCache(maxsize=64, ttl=900)
+    
+    def fork(self) -> "RiskEngine":
+        """
+        Copy of this engine that can be evaluated on another thread.
+        
+        The copy starts from this engine's fitted models and cached signal
+        frames and fits, so new bars are scored incrementally by the
+        current HMM instead of refitting it. Cached frames and fitted
+        parameters are never modified once built and are shared; the regime
+        models are shallow-copied because scoring updates their last-scored
+        state. Results are not carried over: they are keyed by the last bar.
+        """
+        engine = copy.copy(self)
+        engine.regime_model = copy.copy(self.regime_model)
+        engine._signal_cache = LRUCache(maxsize=self._signal_cache.maxsize)
+        engine._signal_cache.update(self._signal_cache)
+        engine._fit_cache = LRUCache(maxsize=self._fit_cache.maxsize)
+        for key, (regime_model, *rest) in self._fit_cache.items():
+            engine._fit_cache[key] = (copy.copy(regime_model), *rest)
+        engine._result_cache = TTLCache(
+            maxsize=self._result_cache.maxsize, ttl=self._result_cache.ttl
+        )
+        return engine
     
     def evaluate(
         self,
@@ -68,21 +128,41 @@ class RiskEngine:
         Returns:
             RiskAnalysisResult with all metrics
         """
-        # Compute returns
-        returns = np.log(data['close'] / data['close'].shift(1))
-        
-        # 1. Compute signals
-        vol_sigs = self.vol_signals.compute_all(data)
-        lev_sigs = self.lev_signals.compute_all(data)
-        micro_sigs = self.micro_signals.compute_all(data)
+        key = (
+            profile.name,
+            horizon_hours,
+            len(data),
+            data.index[-1],
+            float(data['close'].iat[-1]),
+        )
+        cached = self._result_cache.get(key)
+        if cached is None:
+            cached = self._evaluate(data, profile, horizon_hours)
+            self._result_cache[key] = cached
+        # Callers may adjust fields (e.g. current_price); hand out a copy
+        return dataclasses.replace(cached)
+    
+    def _evaluate(
+        self,
+        data: pd.DataFrame,
+        profile: RiskProfile,
+        horizon_hours: int
+    ) -> RiskAnalysisResult:
+        """Uncached evaluate."""
+        crash_model = CrashProbabilityModel(
+            self.config['models']['crash_probability'],
+            profile.weights,
+            profile.weight_vec,
+        )
         
-        # 2. Fit regime model
-        self.regime_model.fit(returns)
-        regime_probs = self.regime_model.predict_proba(returns)
-        regime = self.regime_model.predict_regime(returns)
+        # 1. Compute signals (only those this profile's weights or the
+        # result read; shared by every profile on the same bars)
+        needed = crash_model.required_signals() | _RESULT_SIGNALS
+        m, vol_sigs, lev_sigs, micro_sigs = self._compute_signals(data, needed)
+        returns = m.series(m.returns)
         
-        # 3. Fit EVT model
-        self.evt_model.fit(returns)
+        # 2-3. Fit regime + EVT models (skipped if these returns were seen)
+        regime_probs, regime = self._fit_models(returns)
         
         # 4. Calculate crash probability
         signals_dict = {
@@ -90,20 +170,12 @@ class RiskEngine:
             'leverage': lev_sigs,
             'microstructure': micro_sigs,
             'regime_probs': regime_probs,
-            'evt_tail_shape': pd.Series(
-                self.evt_model.tail_index(),
-                index=data.index
-            )
+            'evt_tail_shape': self.evt_model.tail_index(),
         }
         
-        crash_model = CrashProbabilityModel(
-            self.config['models']['crash_probability'],
-            profile.weights
-        )
         crash_prob_series = crash_model.calculate(signals_dict)
         
         # 5. Get latest values
-        latest_idx = data.index[-1]
         crash_prob = crash_prob_series.iloc[-1]
         current_regime = regime.iloc[-1]
         lcvi = lev_sigs['lcvi'].iloc[-1]
@@ -136,9 +208,84 @@ class RiskEngine:
             tail_shape=float(self.evt_model.tail_index()),
             recommended_exposure=float(recommended_exposure),
             exposure_rationale=rationale,
-            current_price=float(data['close'].iloc[-1]),
-            analysis_timestamp=datetime.utcnow().isoformat()
+            current_price=float(m.close[-1]),
+            analysis_timestamp_ns=time.time_ns()
+        )
+    
+    def _compute_signals(
+        self, data: pd.DataFrame, needed: set[str]
+    ) -> tuple[MarketArrays, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Market arrays (close, volume, log returns) and the three signal
+        families, reusing an earlier computation on identical data.
+
+        Signals do not depend on the risk profile, so a query under a
+        different profile on the same bars only reruns the crash model.
+        An entry is reused when it covers the needed columns; otherwise it
+        is recomputed for the union, so alternating profiles settle on one
+        entry.
+
+        Returns:
+            (market_arrays, vol_sigs, lev_sigs, micro_sigs)
+        """
+        close = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
+        digest = hashlib.blake2b(close.tobytes(), digest_size=16)
+        digest.update(np.ascontiguousarray(data['volume'].to_numpy()).tobytes())
+        key = (digest.digest(), len(data), data.index[-1])
+        cached = self._signal_cache.get(key)
+        if cached is not None and needed <= cached[0]:
+            return cached[1]
+        if cached is not None:
+            needed = needed | cached[0]
+        m = MarketArrays.from_frame(data)
+        signals = (
+            m,
+            self.vol_signals.compute_all(m, needed),
+            self.lev_signals.compute_all(m),
+            self.micro_signals.compute_all(m, needed),
+        )
+        self._signal_cache[key] = (frozenset(needed), signals)
+        return signals
+    
+    def _fit_models(self, returns: pd.Series) -> tuple[pd.DataFrame, pd.Series]:
+        """
+        Fit the regime and EVT models, reusing an earlier fit on identical data.
+
+        Both fits are deterministic in the returns (the HMM has a fixed
+        random_state), so until a new bar arrives the fitted models and
+        regime predictions can be served from cache.
+
+        When the returns only append bars to the series the current HMM
+        last scored, and it was fitted at most refit_every_bars ago, the
+        HMM is kept and the new bars are scored by forward steps instead
+        of refitting. EVT is cheap and always refitted.
+
+        Returns:
+            (regime_probs, regime)
+        """
+        key = (
+            hashlib.blake2b(returns.to_numpy().tobytes(), digest_size=16).digest(),
+            len(returns),
+            returns.index[-1],
         )
+        cached = self._fit_cache.get(key)
+        if cached is None:
+            regime_model = self.regime_model
+            if not regime_model.extends_scored(returns, self._refit_every_bars):
+                regime_model = RegimeHMM(self.config['models']['regime_hmm'])
+                regime_model.fit(returns)
+            evt_model = ExtremeValueModel(self.config['models']['evt'])
+            evt_model.fit(returns)
+            cached = (
+                regime_model,
+                evt_model,
+                regime_model.predict_proba(returns),
+                regime_model.predict_regime(returns),
+            )
+            self._fit_cache[key] = cached
+        
+        self.regime_model, self.evt_model, regime_probs, regime = cached
+        return regime_probs, regime
     
     def _calculate_exposure(
         self,
@@ -159,33 +306,32 @@ class RiskEngine:
         reasons = []
         
         # Start with profile's max normal exposure
-        exposure = profile.max_exposure_normal
+        normal = profile.max_exposure_normal
+        stress = profile.max_exposure_stress
+        exposure = normal
         
         # Adjust based on crash probability
         if crash_prob > profile.crash_cutoff_high:
-            exposure = min(exposure, profile.max_exposure_stress)
+            exposure = min(exposure, stress)
             reasons.append(f"crash_prob={crash_prob:.2f} (HIGH)")
         elif crash_prob > profile.crash_cutoff_medium:
-            exposure = min(exposure, profile.max_exposure_normal * 0.6)
+            exposure = min(exposure, normal * 0.6)
             reasons.append(f"crash_prob={crash_prob:.2f} (MEDIUM)")
         
         # Adjust based on LCVI
-        lcvi_critical = self.config['thresholds']['lcvi_critical']
-        lcvi_warning = self.config['thresholds']['lcvi_warning']
-        
-        if lcvi > lcvi_critical:
-            exposure = min(exposure, profile.max_exposure_stress)
+        if lcvi > self._lcvi_critical:
+            exposure = min(exposure, stress)
             reasons.append(f"LCVI={lcvi:.2f} (CRITICAL)")
-        elif lcvi > lcvi_warning:
-            exposure = min(exposure, profile.max_exposure_normal * 0.7)
+        elif lcvi > self._lcvi_warning:
+            exposure = min(exposure, normal * 0.7)
             reasons.append(f"LCVI={lcvi:.2f} (WARNING)")
         
         # Adjust based on regime
         if regime == 'Crash':
-            exposure = min(exposure, profile.max_exposure_stress)
+            exposure = min(exposure, stress)
             reasons.append("regime=Crash")
         elif regime == 'Volatile':
-            exposure = min(exposure, profile.max_exposure_normal * 0.8)
+            exposure = min(exposure, normal * 0.8)
             reasons.append("regime=Volatile")
         
         # Build rationale
@@ -7,16 +7,118 @@ This is where the LLM is ALLOWED to operate - but ONLY for:
 
 ALL MATH IS DONE IN RISK ENGINE.
 """
+import io
+import os
+import threading
+import time
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 import structlog
 from typing import Any
 from pathlib import Path
+from pydantic import BaseModel, ValidationError
+
+from flare_ai_defai.settings import get_settings
 
 from .types import UserIntent, RiskAppetite, RISK_PROFILES, RiskAnalysisResult
 from .engine.risk_engine import RiskEngine
 
 logger = structlog.get_logger(__name__)
 
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+# Loaded and NaN-checked but not used by any signal
+PASSTHROUGH_COLUMNS = ("open", "high", "low")
+TIMESTAMP_KEYS = ("open time", "open_time", "timestamp", "time", "date")
+
+
+# Binance kline CSV schema, parsed directly by the Arrow reader
+ARROW_COLUMN_TYPES = {
+    "open_time": pa.int64(),
+    **{c: pa.float64() for c in OHLCV_COLUMNS},
+}
+
+
+# Cleaned OHLCV frame from the last load of each source, keyed by path and
+# gated on (st_mtime_ns, st_size) so an unchanged store is never re-read.
+# The cached frame is shared between instances and must be treated as read-only.
+_DATA_CACHE: dict[Path, tuple[tuple[int, int], pd.DataFrame]] = {}
+
+
+# format_response risk label, indexed by (crash_prob > 0.3) + (crash_prob > 0.6)
+_RISK_LEVELS = ("LOW RISK", "MEDIUM RISK", "HIGH RISK")
+
+
+def _is_needed_column(name: str) -> bool:
+    """Keep only OHLCV and timestamp-like columns when parsing the CSV."""
+    c = str(name).strip().lower()
+    return c in OHLCV_COLUMNS or any(k in c for k in TIMESTAMP_KEYS)
+
+
+def _read_tail_bytes(path: Path, n_rows: int, chunk_size: int = 64 * 1024) -> bytes:
+    """
+    Header line plus the last n_rows lines of a CSV, read backwards from
+    the end of the file in chunk_size blocks instead of parsing it whole.
+    """
+    with path.open("rb") as f:
+        header = f.readline()
+        body_start = f.tell()
+        pos = f.seek(0, os.SEEK_END)
+        chunks: list[bytes] = []
+        newlines = 0
+        # One extra newline: the first chunk line may be partial
+        while pos > body_start and newlines <= n_rows:
+            step = min(chunk_size, pos - body_start)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    lines = b"".join(reversed(chunks)).splitlines(keepends=True)
+    if pos > body_start:
+        lines = lines[1:]
+    return header + b"".join(lines[-n_rows:])
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    """
+    Read the candle CSV, using the multi-threaded Arrow reader with a typed
+    schema when enabled. Files that don't match the Binance schema fall back
+    to the flexible pandas path.
+
+    When settings.csv_tail_rows is set only that many trailing rows are
+    read and parsed.
+    """
+    source: Path | io.BytesIO = path
+    settings = get_settings()
+    if settings.csv_tail_rows > 0:
+        tail = _read_tail_bytes(path, settings.csv_tail_rows)
+        source = io.BytesIO(tail)
+    if settings.use_arrow_io:
+        try:
+            table = pv.read_csv(
+                source,
+                read_options=pv.ReadOptions(use_threads=True),
+                convert_options=pv.ConvertOptions(
+                    column_types=ARROW_COLUMN_TYPES,
+                    include_columns=list(ARROW_COLUMN_TYPES),
+                ),
+            )
+            return table.to_pandas(split_blocks=True)
+        except (pa.ArrowInvalid, KeyError) as e:
+            logger.debug("arrow_csv_read_failed", error=str(e))
+    if isinstance(source, io.BytesIO):
+        source = io.BytesIO(tail)
+    return pd.read_csv(
+        source,
+        usecols=_is_needed_column,
+        parse_dates=False,
+        engine="c",
+        memory_map=isinstance(source, Path),
+    )
+
 
 class RiskAnalysisIntegration:
     """
@@ -32,21 +134,63 @@ class RiskAnalysisIntegration:
     - ALL trading recommendations
     """
     
-    def __init__(self, strict_data: bool = True):
+    def __init__(
+        self, strict_data: bool = True, refresh_seconds: float | None = None
+    ):
         self.engine = RiskEngine()
+        self._strict_data = strict_data
+        self._mock_data = False
         self.data = self._load_data(strict=strict_data)
+        
+        # RiskEngine caches and refits its models in place, so request
+        # evaluations on the live engine are serialised; the refresher
+        # builds its own engine and only takes the lock to swap it in
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        # Frame the last refresh evaluated; _load_data returns the same
+        # object while the file is unchanged
+        self._refreshed_data: pd.DataFrame | None = None
+        if refresh_seconds is None:
+            refresh_seconds = get_settings().risk_refresh_seconds
+        if refresh_seconds > 0:
+            threading.Thread(
+                target=self._refresh_loop,
+                args=(refresh_seconds,),
+                name="risk-refresh",
+                daemon=True,
+            ).start()
     
     def _load_data(self, strict: bool = True) -> pd.DataFrame:
-        """Load BTC 15min data from teammate CSV (Open time format)."""
+        """Load BTC 15min data (Parquet store, falling back to teammate CSV)."""
         data_path = Path(__file__).parent / "data" / "btc_15m_data.csv"
+        parquet_path = data_path.with_suffix(".parquet")
 
-        if not data_path.exists():
+        if parquet_path.exists():
+            source = parquet_path
+        elif data_path.exists():
+            source = data_path
+        else:
             if strict:
                 raise FileNotFoundError(f"btc_15m_data.csv not found at: {data_path}")
             logger.warning("btc_15m_data.csv not found - using mock data")
+            self._mock_data = True
             return self._create_mock_data()
 
-        df = pd.read_csv(data_path)
+        st = source.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _DATA_CACHE.get(source)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        if source == parquet_path:
+            df = pd.read_parquet(
+                parquet_path,
+                columns=["open_time", *OHLCV_COLUMNS],
+                engine="pyarrow",
+                memory_map=True,
+            )
+        else:
+            df = _read_csv(data_path)
 
         # 1) Clean column names (Julia does strip)
         df.columns = [str(c).strip() for c in df.columns]
@@ -60,7 +204,7 @@ class RiskAnalysisIntegration:
         else:
             candidates = [
                 c for c in df.columns
-                if any(k in c.lower() for k in ("open time", "open_time", "timestamp", "time", "date"))
+                if any(k in c.lower() for k in TIMESTAMP_KEYS)
             ]
             if not candidates:
                 raise ValueError(f"No timestamp column found. Columns: {list(df.columns)}")
@@ -96,7 +240,7 @@ class RiskAnalysisIntegration:
         df = df[~df.index.duplicated(keep="last")].sort_index()
 
         # 7) Ensure OHLCV columns exist
-        required = ["open", "high", "low", "close", "volume"]
+        required = OHLCV_COLUMNS
         missing = [c for c in required if c not in df.columns]
         if missing:
             raise ValueError(
@@ -110,30 +254,77 @@ class RiskAnalysisIntegration:
             out[c] = pd.to_numeric(out[c], errors="coerce")
 
         out = out.dropna(subset=["open", "high", "low", "close"])
+
+        # 9) Downcast the columns no signal reads; close and volume feed
+        # every rolling reducer and stay float64 so results don't move
+        out = out.astype({c: np.float32 for c in PASSTHROUGH_COLUMNS}, copy=False)
+        _DATA_CACHE[source] = (stamp, out)
         return out
 
     
     def _create_mock_data(self) -> pd.DataFrame:
         """Create mock data for testing"""
-        import numpy as np
-        from datetime import datetime, timedelta
-        
         n = 2000
         base_price = 50000
-        timestamps = [datetime.now() - timedelta(minutes=15*i) for i in range(n)][::-1]
+        index = pd.date_range(
+            end=pd.Timestamp.now().floor("15min"), periods=n, freq="15min"
+        )
         
-        returns = np.random.normal(0, 0.01, n)
-        prices = base_price * np.exp(np.cumsum(returns))
+        # One draw for all five noise streams: returns, open, high, low, volume
+        z = np.random.default_rng().standard_normal((5, n))
+        prices = base_price * np.exp(np.cumsum(z[0] * 0.01))
         
-        df = pd.DataFrame({
-            'open': prices * (1 + np.random.normal(0, 0.001, n)),
-            'high': prices * (1 + abs(np.random.normal(0, 0.002, n))),
-            'low': prices * (1 - abs(np.random.normal(0, 0.002, n))),
+        return pd.DataFrame({
+            'open': prices * (1 + z[1] * 0.001),
+            'high': prices * (1 + np.abs(z[2]) * 0.002),
+            'low': prices * (1 - np.abs(z[3]) * 0.002),
             'close': prices,
-            'volume': np.random.lognormal(10, 1, n)
-        }, index=pd.DatetimeIndex(timestamps))
+            'volume': np.exp(10 + z[4]),
+        }, index=index)
+    
+    def refresh(self, horizon_hours: int = 24) -> None:
+        """
+        Reload the data if its file changed and evaluate every risk profile.
         
-        return df
+        Unchanged data (the same cached frame) is not re-evaluated. New
+        data is evaluated outside the lock on a fork of the current engine,
+        so requests keep being served meanwhile and the fork scores the new
+        bars with the current HMM fit. The warmed engine and its data are
+        then swapped in together: an analyze on the same bar and horizon
+        returns from its result cache, and other horizons reuse its cached
+        signals and model fits.
+        """
+        data = self.data if self._mock_data else self._load_data(self._strict_data)
+        if data is self._refreshed_data:
+            return
+        with self._lock:
+            engine = self.engine.fork()
+        for profile in RISK_PROFILES.values():
+            engine.evaluate(data, profile, horizon_hours)
+        with self._lock:
+            self.engine, self.data = engine, data
+        self._refreshed_data = data
+    
+    def _refresh_loop(self, period: float) -> None:
+        """Background thread body: refresh now, then every period seconds."""
+        while True:
+            started = time.perf_counter()
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the last good results; retry next period
+                logger.exception("risk_refresh_failed")
+            else:
+                logger.debug(
+                    "risk_refresh_complete",
+                    seconds=round(time.perf_counter() - started, 3),
+                )
+            if self._stop.wait(period):
+                return
+    
+    def close(self) -> None:
+        """Stop the background refresher (no-op when it is not running)."""
+        self._stop.set()
     
     def analyze(self, intent: UserIntent) -> RiskAnalysisResult:
         """
@@ -154,11 +345,12 @@ class RiskAnalysisIntegration:
             horizon_hours=intent.horizon_hours
         )
         
-        result = self.engine.evaluate(
-            data=self.data,
-            profile=profile,
-            horizon_hours=intent.horizon_hours
-        )
+        with self._lock:
+            result = self.engine.evaluate(
+                data=self.data,
+                profile=profile,
+                horizon_hours=intent.horizon_hours
+            )
         
         logger.info(
             "risk_analysis_complete",
@@ -178,11 +370,12 @@ class RiskAnalysisIntegration:
         Deterministic risk analysis for snapshot production (NO LLM).
         """
         profile = RISK_PROFILES[risk_appetite]
-        return self.engine.evaluate(
-            data=self.data,
-            profile=profile,
-            horizon_hours=horizon_hours,
-    )
+        with self._lock:
+            return self.engine.evaluate(
+                data=self.data,
+                profile=profile,
+                horizon_hours=horizon_hours,
+            )
 
     @staticmethod
     def to_snapshot_dict(
@@ -224,34 +417,37 @@ class RiskAnalysisIntegration:
         Returns:
             Formatted response string
         """
-        # Determine risk level
-        if result.crash_prob > 0.6:
-            risk_level = "HIGH RISK"
-        elif result.crash_prob > 0.3:
-            risk_level = "MEDIUM RISK"
-        else:
-            risk_level = "LOW RISK"
+        cp = result.crash_prob
+        risk_level = _RISK_LEVELS[int(cp > 0.3) + int(cp > 0.6)]
+        lcvi_flag = "⚠️ ELEVATED" if result.lcvi > 2.0 else "✓ Normal"
         
-        # Format main response
-        response_parts = [
-            f"📊 **Risk Analysis for {intent.position_size_btc} BTC ({intent.risk_appetite.value} risk profile)**",
-            "",
-            f"**Crash Probability ({intent.horizon_hours}h):** {result.crash_prob:.1%} ({risk_level})",
-            f"**Market Regime:** {result.regime}",
-            f"**LCVI:** {result.lcvi:.2f} {'⚠️ ELEVATED' if result.lcvi > 2.0 else '✓ Normal'}",
-            f"**Realized Volatility:** {result.realized_vol:.1%} annualized",
-            "",
-            f"**99% VaR (1-day):** {result.var_1d:.1%} potential loss",
-            f"**Expected Shortfall:** {result.es_1d:.1%}",
-            "",
-            f"**Recommended Exposure:** {result.recommended_exposure:.0%} of position",
-            f"**Rationale:** {result.exposure_rationale}",
-            "",
-            f"_Current BTC Price: ${result.current_price:,.2f}_",
+        # One f-string: the literals concatenate at compile time and the
+        # fields format inline, with no intermediate list or join
+        return (
+            f"📊 **Risk Analysis for {intent.position_size_btc} BTC ({intent.risk_appetite.value} risk profile)**\n"
+            "\n"
+            f"**Crash Probability ({intent.horizon_hours}h):** {cp:.1%} ({risk_level})\n"
+            f"**Market Regime:** {result.regime}\n"
+            f"**LCVI:** {result.lcvi:.2f} {lcvi_flag}\n"
+            f"**Realized Volatility:** {result.realized_vol:.1%} annualized\n"
+            "\n"
+            f"**99% VaR (1-day):** {result.var_1d:.1%} potential loss\n"
+            f"**Expected Shortfall:** {result.es_1d:.1%}\n"
+            "\n"
+            f"**Recommended Exposure:** {result.recommended_exposure:.0%} of position\n"
+            f"**Rationale:** {result.exposure_rationale}\n"
+            "\n"
+            f"_Current BTC Price: ${result.current_price:,.2f}_\n"
             f"_Analysis Time: {result.analysis_timestamp}_"
-        ]
-        
-        return "\n".join(response_parts)
+        )
+
+
+class _IntentReply(BaseModel):
+    """Intent-extraction JSON; decoded and coerced in one pass."""
+    position_size_btc: float = 1.0
+    risk_appetite: RiskAppetite = RiskAppetite.MEDIUM
+    horizon_hours: int = 24
+    specific_concerns: str = ""
 
 
 def parse_user_intent_with_llm(ai_provider: Any, user_message: str) -> UserIntent:
@@ -268,8 +464,6 @@ def parse_user_intent_with_llm(ai_provider: Any, user_message: str) -> UserInten
     Returns:
         Structured UserIntent
     """
-    import json
-    
     extraction_prompt = f"""
 Extract the following information from the user's message:
 
@@ -290,22 +484,17 @@ Output: {{"position_size_btc": 2.0, "risk_appetite": "medium", "horizon_hours":
 JSON:
 """
     
-    response = ai_provider.generate(
+    # Provider errors propagate: the caller's circuit breaker counts them
+    # and the user sees an error, not an analysis of a default intent
+    text = ai_provider.generate(
         prompt=extraction_prompt,
         response_mime_type="application/json"
-    )
+    ).text
     
     try:
-        parsed = json.loads(response.text)
-        
-        return UserIntent(
-            position_size_btc=float(parsed.get('position_size_btc', 1.0)),
-            risk_appetite=RiskAppetite(parsed.get('risk_appetite', 'medium')),
-            horizon_hours=int(parsed.get('horizon_hours', 24)),
-            specific_concerns=parsed.get('specific_concerns', '')
-        )
-    except Exception as e:
-        logger.error("intent_parsing_failed", error=str(e), response=response.text)
+        parsed = _IntentReply.model_validate_json(text)
+    except ValidationError as e:
+        logger.error("intent_parsing_failed", error=str(e), response=text)
         
         # Fallback to defaults
         return UserIntent(
@@ -313,4 +502,11 @@ JSON:
             risk_appetite=RiskAppetite.MEDIUM,
             horizon_hours=24,
             specific_concerns=user_message
-        )
\ No newline at end of file
+        )
+    
+    return UserIntent(
+        position_size_btc=parsed.position_size_btc,
+        risk_appetite=parsed.risk_appetite,
+        horizon_hours=parsed.horizon_hours,
+        specific_concerns=parsed.specific_concerns
+    )
\ No newline at end of file
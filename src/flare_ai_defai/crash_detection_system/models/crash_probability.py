@@ -7,20 +7,70 @@ import numpy as np
 import pandas as pd
 from typing import Dict
 
+from .._kernels import NUMBA_AVAILABLE
+from .._kernels import rank
+from ..types import SIGNAL_ORDER, weight_vector
+
+
+# Weight name -> (signal family, column) it ranks
+_SIGNAL_SOURCES = {
+    'vol_regime': ('volatility', 'vol_regime'),
+    'lcvi': ('leverage', 'lcvi'),
+    'dd_velocity': ('leverage', 'dd_velocity'),
+    'funding_stress': ('leverage', 'funding_stress'),
+    'illiquidity': ('microstructure', 'illiquidity_ratio'),
+    'regime_prob': ('regime_probs', 'prob_Crash'),
+}
+
+
+def _pct_rank(values: np.ndarray) -> np.ndarray:
+    """
+    Percentile rank, equivalent to Series.rank(pct=True).
+
+    Ties get their average rank, NaNs stay NaN and ranks are divided by
+    the non-NaN count.
+    """
+    out = np.full(values.shape[0], np.nan)
+    count = np.count_nonzero(~np.isnan(values))
+    if not count:
+        return out
+    order = np.argsort(values)[:count]  # NaNs sort last
+    ordered = values[order]
+    starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+    ends = np.r_[starts[1:], count]
+    out[order] = np.repeat((starts + ends + 1) / 2 / count, ends - starts)
+    return out
+
 
 class CrashProbabilityModel:
     """Weighted ensemble crash probability model"""
     
-    def __init__(self, config: Dict, weights: Dict[str, float]):
+    def __init__(
+        self,
+        config: Dict,
+        weights: Dict[str, float],
+        weight_vec: np.ndarray | None = None,
+    ):
         """
         Args:
             config: Model configuration
             weights: Signal weights from RiskProfile
+            weight_vec: weights in SIGNAL_ORDER (RiskProfile.weight_vec);
+                built from weights when omitted
         """
         self.config = config
         self.weights = weights
+        self.weight_vec = weight_vector(weights) if weight_vec is None else weight_vec
+    
+    def required_signals(self) -> set[str]:
+        """Signal columns calculate() reads for these weights."""
+        return {
+            _SIGNAL_SOURCES[col][1]
+            for col, w in zip(SIGNAL_ORDER, self.weight_vec)
+            if w and col in _SIGNAL_SOURCES
+        }
     
-    def calculate(self, signals: Dict[str, pd.DataFrame]) -> pd.Series:
+    def calculate(self, signals: Dict[str, pd.DataFrame | float]) -> pd.Series:
         """
         Calculate crash probability from signals.
         
@@ -30,53 +80,56 @@ class CrashProbabilityModel:
         3. Sigmoid: P(crash) = 1 / (1 + exp(-5(score - 0.5)))
         
         Args:
-            signals: Dict of signal DataFrames
+            signals: Dict of signal DataFrames; 'evt_tail_shape' is a scalar
         
         Returns:
             Crash probability series [0, 1]
         """
-        # Combine all signals into one DataFrame
-        all_signals = pd.DataFrame(index=signals['volatility'].index)
-        
-        # Extract relevant signals
-        if 'vol_regime' in signals['volatility'].columns:
-            all_signals['vol_regime'] = signals['volatility']['vol_regime']
-        
-        if 'lcvi' in signals['leverage'].columns:
-            all_signals['lcvi'] = signals['leverage']['lcvi']
-        
-        if 'dd_velocity' in signals['leverage'].columns:
-            all_signals['dd_velocity'] = signals['leverage']['dd_velocity']
-        
-        if 'funding_stress' in signals['leverage'].columns:
-            all_signals['funding_stress'] = signals['leverage']['funding_stress']
-        
-        if 'illiquidity_ratio' in signals['microstructure'].columns:
-            all_signals['illiquidity'] = signals['microstructure']['illiquidity_ratio']
-        
-        # Add regime probabilities
-        if 'regime_probs' in signals:
-            all_signals['regime_prob'] = signals['regime_probs']['prob_Crash']
-        
-        # Add EVT tail shape
-        if 'evt_tail_shape' in signals:
-            all_signals['evt_tail'] = signals['evt_tail_shape']
+        index = signals['volatility'].index
+        n = len(index)
+        
+        # Gather the weighted signal columns as raw arrays
+        columns: Dict[str, np.ndarray] = {}
+        for col, w in zip(SIGNAL_ORDER, self.weight_vec):
+            source = _SIGNAL_SOURCES.get(col)
+            if source is None or not w:
+                continue
+            group, name = source
+            frame = signals.get(group)
+            if frame is not None and name in frame.columns:
+                values = frame[name]
+                # regime_probs starts at the first return, one bar late
+                if not values.index.equals(index):
+                    values = values.reindex(index)
+                columns[col] = values.to_numpy(dtype=np.float64)
         
         # Normalize signals to [0, 1] using percentile rank
-        normalized = pd.DataFrame(index=all_signals.index)
-        
-        for col in all_signals.columns:
-            if col in self.weights:
-                normalized[col] = all_signals[col].rank(pct=True)
-        
-        # Weighted sum
-        score = pd.Series(0, index=all_signals.index)
-        total_weight = 0
-        
-        for col, weight in self.weights.items():
-            if col in normalized.columns:
-                score += normalized[col] * weight
-                total_weight += weight
+        pct: Dict[str, np.ndarray | float] = {}
+        if NUMBA_AVAILABLE and columns:
+            # One parallel kernel call over a column-major (n, k) matrix
+            matrix = np.empty((n, len(columns)), order='F')
+            for j, values in enumerate(columns.values()):
+                matrix[:, j] = values
+            pct.update(zip(columns, rank.rank_pct_cols(matrix).T))
+        else:
+            pct.update((col, _pct_rank(values)) for col, values in columns.items())
+        
+        # EVT tail shape is one value for the whole window: every bar ties,
+        # so its average percentile rank is (n + 1) / (2n)
+        if 'evt_tail_shape' in signals and n:
+            pct['evt_tail'] = ((n + 1) / 2) / n
+        
+        used = [
+            (pct[col], w) for col, w in zip(SIGNAL_ORDER, self.weight_vec)
+            if w and col in pct
+        ]
+        total_weight = sum(w for _, w in used)
+        
+        # Weighted sum, accumulated in SIGNAL_ORDER (a BLAS matvec would
+        # reassociate the sum and move the result by an ulp)
+        score = np.zeros(n, dtype=np.float64)
+        for values, w in used:
+            score += values * w
         
         if total_weight > 0:
             score /= total_weight
@@ -84,4 +137,4 @@ class CrashProbabilityModel:
         # Sigmoid transformation to probability
         crash_prob = 1 / (1 + np.exp(-5 * (score - 0.5)))
         
-        return crash_prob
+        return pd.Series(crash_prob, index=index)
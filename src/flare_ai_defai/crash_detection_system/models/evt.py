@@ -9,6 +9,9 @@ import pandas as pd
 from scipy import stats
 from typing import Dict, Tuple
 
+from .._kernels import NUMBA_AVAILABLE
+from .._kernels import gpd
+
 
 class ExtremeValueModel:
     """GPD model for tail risk estimation"""
@@ -34,7 +37,16 @@ class ExtremeValueModel:
             self.shape = 0.2
             self.scale = exceedances.std() if len(exceedances) > 0 else 0.01
         else:
-            self.shape, _, self.scale = stats.genpareto.fit(exceedances, floc=0)
+            shape = scale = np.nan
+            if NUMBA_AVAILABLE:
+                # Exact profile-likelihood MLE (Grimshaw)
+                shape, scale = gpd.gpd_fit_grimshaw(
+                    exceedances.to_numpy(dtype=np.float64)
+                )
+            if np.isfinite(shape) and np.isfinite(scale):
+                self.shape, self.scale = float(shape), float(scale)
+            else:
+                self.shape, _, self.scale = stats.genpareto.fit(exceedances, floc=0)
 
         return self
 
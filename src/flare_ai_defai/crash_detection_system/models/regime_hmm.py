@@ -9,6 +9,7 @@ Uses hmmlearn library for Gaussian HMM with 3 states:
 import numpy as np
 import pandas as pd
 import warnings
+from scipy import stats
 from typing import Dict
 from numpy.typing import NDArray
 from hmmlearn.hmm import GaussianHMM
@@ -30,6 +31,11 @@ class RegimeHMM:
         self.config = config
         self.model = None
         self.regime_labels = ['Calm', 'Volatile', 'Crash']
+        self.n_train = 0
+        
+        # Last series scored by predict_proba (returns, probs), so a series
+        # that only appends bars is extended by forward steps
+        self._scored: tuple[NDArray[np.float64], pd.DataFrame] | None = None
     
     def fit(self, returns: pd.Series) -> 'RegimeHMM':
         """
@@ -55,6 +61,8 @@ class RegimeHMM:
         
         self.model.fit(X)
         self._sort_regimes()
+        self.n_train = len(X)
+        self._scored = None
         
         return self
     
@@ -65,30 +73,72 @@ class RegimeHMM:
             return
 
         model = cast(GaussianHMM, self.model)
-        covars = np.asarray(model.covars_)  # keep original shape
-
-        # Extract per-regime variance (1D returns case)
-        # hmmlearn expects:
-        # - full: (n_components, n_dim, n_dim)
-        # - diag: (n_components, n_dim)
-        # - spherical: (n_components,)
-        if covars.ndim == 3:          # full
-            variances = covars[:, 0, 0]
-        elif covars.ndim == 2:        # diag
-            variances = covars[:, 0]
-        else:                         # spherical
-            variances = covars
+        covars = np.asarray(model.covars_)  # always full: (n, n_dim, n_dim)
 
-        sorted_idx = np.argsort(variances)
+        sorted_idx = np.argsort(self._variances(covars))
 
-        # Reorder HMM parameters consistently
-        model.means_ = model.means_[sorted_idx]
-        model.covars_ = covars[sorted_idx]
+        # Reorder HMM parameters consistently. The covars_ getter returns
+        # full matrices but the setter validates against covariance_type,
+        # so permute back in the layout that type stores
+        model.means_ = np.ascontiguousarray(model.means_[sorted_idx])
+        if model.covariance_type == 'full':
+            model.covars_ = covars[sorted_idx]
+        elif model.covariance_type == 'diag':
+            model.covars_ = np.diagonal(covars, axis1=1, axis2=2)[sorted_idx]
+        elif model.covariance_type == 'spherical':
+            model.covars_ = covars[sorted_idx, 0, 0]
+        # 'tied' shares one matrix between states: nothing to permute
         model.startprob_ = model.startprob_[sorted_idx]
-        model.transmat_ = model.transmat_[sorted_idx][:, sorted_idx]
-
-
+        model.transmat_ = model.transmat_[np.ix_(sorted_idx, sorted_idx)]
+    
+    @staticmethod
+    def _variances(covars: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Per-regime variance (1D returns case).
 
+        hmmlearn expects:
+        - full: (n_components, n_dim, n_dim)
+        - diag: (n_components, n_dim)
+        - spherical: (n_components,)
+        """
+        if covars.ndim == 3:          # full
+            return covars[:, 0, 0]
+        if covars.ndim == 2:          # diag
+            return covars[:, 0]
+        return covars                 # spherical
+    
+    def extends_scored(self, returns: pd.Series, max_new: int) -> bool:
+        """
+        True if returns is the last scored series plus at most max_new bars
+        since the fit, so the fitted model can score it incrementally.
+        """
+        if self.model is None or self._scored is None:
+            return False
+        values, probs = self._scored
+        clean = returns.dropna()
+        m = len(values)
+        return (
+            m <= len(clean) <= self.n_train + max_new
+            and clean.index[m - 1] == probs.index[-1]
+            and np.array_equal(clean.to_numpy()[:m], values)
+        )
+    
+    def _forward_extend(
+        self, values: NDArray[np.float64], alpha: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """
+        Filtered state probabilities for new bars, one normalized forward
+        step per bar starting from the last known state distribution.
+        """
+        model = cast(GaussianHMM, self.model)
+        sd = np.sqrt(self._variances(np.asarray(model.covars_)))
+        emission = stats.norm.pdf(values[:, None], loc=model.means_[:, 0], scale=sd)
+        out = np.empty((len(values), len(alpha)))
+        for t in range(len(values)):
+            alpha = (alpha @ model.transmat_) * emission[t]
+            alpha /= alpha.sum()
+            out[t] = alpha
+        return out
     
     def predict_regime(self, returns: pd.Series) -> pd.Series:
         """
@@ -103,12 +153,18 @@ class RegimeHMM:
         if not HMM_AVAILABLE or not self.model:
             return self._fallback_regime(returns)
         
-        X = returns.dropna().to_numpy().reshape(-1, 1)
-        regimes = self.model.predict(X)
+        clean = returns.dropna()
+        if self.extends_scored(clean, len(clean)) and len(clean) > self.n_train:
+            # Bars past the training window: most likely filtered state
+            tail = self.predict_proba(clean).to_numpy()[self.n_train:]
+            head = self.model.predict(clean.to_numpy()[:self.n_train].reshape(-1, 1))
+            regimes = np.concatenate([head, tail.argmax(axis=1)])
+        else:
+            regimes = self.model.predict(clean.to_numpy().reshape(-1, 1))
         
         regime_series = pd.Series(
-            [self.regime_labels[r] for r in regimes],
-            index=returns.dropna().index,
+            np.array(self.regime_labels)[regimes],
+            index=clean.index,
             name='regime'
         )
         
@@ -127,35 +183,44 @@ class RegimeHMM:
         if not HMM_AVAILABLE or not self.model:
             return self._fallback_proba(returns)
         
-        X = returns.dropna().to_numpy().reshape(-1, 1)
-        probs = self.model.predict_proba(X)
+        clean = returns.dropna()
+        values = clean.to_numpy()
+        if self.extends_scored(clean, len(clean)):
+            scored_values, scored = self._scored
+            m = len(scored_values)
+            if m == len(values):
+                return scored
+            new = self._forward_extend(values[m:], scored.to_numpy()[-1])
+            probs = np.concatenate([scored.to_numpy(), new])
+        else:
+            probs = self.model.predict_proba(values.reshape(-1, 1))
         
         prob_df = pd.DataFrame(
             probs,
-            index=returns.dropna().index,
+            index=clean.index,
             columns=[f'prob_{label}' for label in self.regime_labels]
         )
+        self._scored = (values, prob_df)
         
         return prob_df
     
+    def _fallback_codes(self, returns: pd.Series) -> NDArray[np.int8]:
+        """Regime index per bar from rolling vol: 0 Calm, 1 Volatile, 2 Crash."""
+        ann_factor = np.sqrt(365 * 24 * 4)
+        vol = (returns.rolling(96).std() * ann_factor).to_numpy()
+        # Summed comparisons instead of np.digitize: NaN vol stays Calm
+        return (vol > 0.5).astype(np.int8) + (vol > 1.0)
+    
     def _fallback_regime(self, returns: pd.Series) -> pd.Series:
         """Fallback regime detection when HMM unavailable"""
-        ann_factor = np.sqrt(365 * 24 * 4)
-        vol = returns.rolling(96).std() * ann_factor
-        
-        regime = pd.Series('Calm', index=returns.index)
-        regime[vol > 0.5] = 'Volatile'
-        regime[vol > 1.0] = 'Crash'
-        
-        return regime
+        codes = self._fallback_codes(returns)
+        return pd.Series(np.array(self.regime_labels)[codes], index=returns.index)
     
     def _fallback_proba(self, returns: pd.Series) -> pd.DataFrame:
         """Fallback probabilities when HMM unavailable"""
-        regime = self._fallback_regime(returns)
-        
-        probs = pd.DataFrame(index=returns.index)
-        probs['prob_Calm'] = (regime == 'Calm').astype(float)
-        probs['prob_Volatile'] = (regime == 'Volatile').astype(float)
-        probs['prob_Crash'] = (regime == 'Crash').astype(float)
-        
-        return probs
+        codes = self._fallback_codes(returns)
+        return pd.DataFrame(
+            np.eye(len(self.regime_labels))[codes],
+            index=returns.index,
+            columns=[f'prob_{label}' for label in self.regime_labels],
+        )
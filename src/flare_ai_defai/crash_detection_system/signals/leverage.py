@@ -5,6 +5,19 @@ import numpy as np
 import pandas as pd
 from typing import Dict
 
+from .._kernels import NUMBA_AVAILABLE
+from .._kernels import ewm, pipeline, rolling
+from ..types import MarketArrays
+
+
+def _safe_ratio(num: np.ndarray, den: np.ndarray, eps: float = 0.0) -> np.ndarray:
+    """
+    num / den where den > eps, else 0 (a NaN den counts as 0), in one pass.
+    """
+    out = np.zeros(num.shape, dtype=np.float64)
+    np.divide(num, den, out=out, where=den > eps)
+    return out
+
 
 class LeverageSignals:
     """Calculate leverage and liquidation risk signals"""
@@ -29,6 +42,15 @@ class LeverageSignals:
         fast_window = self.config['funding_fast_window']
         slow_window = self.config['funding_slow_window']
         
+        if NUMBA_AVAILABLE:
+            funding = ewm.dual_ema_ratio(
+                prices.to_numpy(dtype=np.float64),
+                fast_window,
+                slow_window,
+                365 * 24 / 8,
+            )
+            return pd.Series(funding, index=prices.index)
+        
         fast_ma = prices.ewm(span=fast_window).mean()
         slow_ma = prices.ewm(span=slow_window).mean()
         
@@ -48,8 +70,17 @@ class LeverageSignals:
             Funding stress ratio
         """
         window = self.config.get('funding_stress_window', 120)
-        median_abs = funding_proxy.abs().rolling(window).median()
-        stress = funding_proxy.abs() / median_abs
+        abs_funding = funding_proxy.abs()
+        if NUMBA_AVAILABLE:
+            median_abs = pd.Series(
+                rolling.rolling_median(
+                    abs_funding.to_numpy(dtype=np.float64), window, window
+                ),
+                index=abs_funding.index,
+            )
+        else:
+            median_abs = abs_funding.rolling(window).median()
+        stress = abs_funding / median_abs
         return stress
     
     def drawdown(self, prices: pd.Series, window: int | None = None) -> pd.Series:
@@ -68,6 +99,10 @@ class LeverageSignals:
         if window is None:
             window = self.config['lcvi_window']
         
+        if NUMBA_AVAILABLE:
+            dd = rolling.drawdown(prices.to_numpy(dtype=np.float64), int(window))
+            return pd.Series(dd, index=prices.index, name=prices.name)
+        
         rolling_max = prices.rolling(window, min_periods=1).max()
         dd = (prices - rolling_max) / rolling_max
         return dd
@@ -83,9 +118,13 @@ class LeverageSignals:
             Drawdown velocity
         """
         dd = self.drawdown(prices)
-        dd_vel = dd.diff().abs() / dd.abs().shift(1)
-        dd_vel = dd_vel.replace([np.inf, -np.inf], 0).fillna(0)
-        return dd_vel
+        values = dd.to_numpy(dtype=np.float64)
+        step = np.full_like(values, np.nan)
+        prev = np.full_like(values, np.nan)
+        np.abs(values[1:] - values[:-1], out=step[1:])
+        np.abs(values[:-1], out=prev[1:])
+        # Bars at the peak (dd = 0) have no defined velocity and read as 0
+        return pd.Series(_safe_ratio(step, prev), index=dd.index, name=dd.name)
     
     def lcvi(self, prices: pd.Series, returns: pd.Series, funding_proxy: pd.Series) -> pd.Series:
         """
@@ -108,8 +147,21 @@ class LeverageSignals:
         """
         # Volatility component
         ann_factor = np.sqrt(self.config['annualization_factor'])
-        vol = returns.rolling(96).std() * ann_factor
-        vol_ref = vol.rolling(self.config['lcvi_vol_ref_window']).median()
+        if NUMBA_AVAILABLE:
+            std = rolling.rolling_std(returns.to_numpy(dtype=np.float64), 96, 96)
+            vol = pd.Series(std, index=returns.index) * ann_factor
+        else:
+            vol = returns.rolling(96).std() * ann_factor
+        ref_window = self.config['lcvi_vol_ref_window']
+        if NUMBA_AVAILABLE:
+            vol_ref = pd.Series(
+                rolling.rolling_median(
+                    vol.to_numpy(dtype=np.float64), ref_window, ref_window
+                ),
+                index=vol.index,
+            )
+        else:
+            vol_ref = vol.rolling(ref_window).median()
         vol_ratio = vol / vol_ref
         
         # Funding stress
@@ -122,23 +174,45 @@ class LeverageSignals:
         lcvi = vol_ratio * (1 + fund_stress) * (1 + dd_vel)
         return lcvi
     
-    def compute_all(self, data: pd.DataFrame) -> pd.DataFrame:
+    def compute_all(self, m: MarketArrays) -> pd.DataFrame:
         """
         Compute all leverage signals.
         
         Args:
-            data: OHLCV DataFrame
+            m: Close/volume/returns arrays of the OHLCV window
         
         Returns:
             DataFrame with leverage signals
         """
-        returns = np.log(data['close'] / data['close'].shift(1))
-        
-        signals = pd.DataFrame(index=data.index)
-        signals['funding_proxy'] = self.synthetic_funding_rate(data['close'])
+        if NUMBA_AVAILABLE:
+            funding, stress, dd, dd_vel, lcvi = pipeline.leverage_signals(
+                m.close,
+                m.returns,
+                self.config['funding_fast_window'],
+                self.config['funding_slow_window'],
+                self.config.get('funding_stress_window', 120),
+                int(self.config['lcvi_window']),
+                self.config['lcvi_vol_ref_window'],
+                np.sqrt(self.config['annualization_factor']),
+            )
+            return pd.DataFrame(
+                {
+                    'funding_proxy': funding,
+                    'funding_stress': stress,
+                    'drawdown': dd,
+                    'dd_velocity': dd_vel,
+                    'lcvi': lcvi,
+                },
+                index=m.index,
+            )
+        
+        close = m.series(m.close)
+        returns = m.series(m.returns)
+        signals = pd.DataFrame(index=m.index)
+        signals['funding_proxy'] = self.synthetic_funding_rate(close)
         signals['funding_stress'] = self.funding_stress(signals['funding_proxy'])
-        signals['drawdown'] = self.drawdown(data['close'])
-        signals['dd_velocity'] = self.drawdown_velocity(data['close'])
-        signals['lcvi'] = self.lcvi(data['close'], returns, signals['funding_proxy'])
+        signals['drawdown'] = self.drawdown(close)
+        signals['dd_velocity'] = self.drawdown_velocity(close)
+        signals['lcvi'] = self.lcvi(close, returns, signals['funding_proxy'])
         
         return signals
@@ -4,6 +4,10 @@ Market microstructure signals - PURE MATH, NO LLM.
 import numpy as np
 import pandas as pd
 
+from .._kernels import NUMBA_AVAILABLE
+from .._kernels import moments, pipeline, rolling
+from ..types import MarketArrays
+
 
 class MicrostructureSignals:
     """Calculate market microstructure signals"""
@@ -27,6 +31,16 @@ class MicrostructureSignals:
             Illiquidity series
         """
         window = self.config['illiquidity_window']
+        if NUMBA_AVAILABLE:
+            return pd.Series(
+                moments.rolling_amihud(
+                    returns.abs().to_numpy(dtype=np.float64),
+                    volume.to_numpy(dtype=np.float64),
+                    window,
+                    window,
+                ),
+                index=returns.index,
+            )
         illiq = returns.abs() / volume
         illiq_rolling = illiq.rolling(window).mean()
         return illiq_rolling
@@ -44,7 +58,15 @@ class MicrostructureSignals:
         """
         illiq = self.amihud_illiquidity(returns, volume)
         ref_window = self.config['illiquidity_ref_window']
-        illiq_ref = illiq.rolling(ref_window).median()
+        if NUMBA_AVAILABLE:
+            illiq_ref = pd.Series(
+                rolling.rolling_median(
+                    illiq.to_numpy(dtype=np.float64), ref_window, ref_window
+                ),
+                index=illiq.index,
+            )
+        else:
+            illiq_ref = illiq.rolling(ref_window).median()
         ratio = illiq / illiq_ref
         return ratio
     
@@ -61,26 +83,61 @@ class MicrostructureSignals:
             Tail risk asymmetry
         """
         window = self.config['tail_risk_window']
-        skew = returns.rolling(window).skew()
-        kurt = returns.rolling(window).kurt()
+        if NUMBA_AVAILABLE:
+            r = returns.to_numpy(dtype=np.float64)
+            idx = returns.index
+            skew = pd.Series(moments.rolling_skew(r, window, window), index=idx)
+            kurt = pd.Series(moments.rolling_kurt(r, window, window), index=idx)
+        else:
+            skew = returns.rolling(window).skew()
+            kurt = returns.rolling(window).kurt()
         tra = -skew * np.sqrt(np.maximum(kurt - 3, 0))
         return tra
     
-    def compute_all(self, data: pd.DataFrame) -> pd.DataFrame:
+    def compute_all(
+        self, m: MarketArrays, needed: set[str] | None = None
+    ) -> pd.DataFrame:
         """
         Compute all microstructure signals.
         
         Args:
-            data: OHLCV DataFrame
+            m: Close/volume/returns arrays of the OHLCV window
+            needed: Signal columns the caller uses (None = all); the
+                illiquidity pair and tail_risk_asym are skipped when absent
         
         Returns:
             DataFrame with microstructure signals
         """
-        returns = pd.Series(np.log(data['close'] / data['close'].shift(1)), index=data.index)
+        with_illiq = needed is None or not needed.isdisjoint(
+            {'illiquidity', 'illiquidity_ratio'}
+        )
+        with_tail = needed is None or 'tail_risk_asym' in needed
+        if NUMBA_AVAILABLE:
+            illiq, ratio, tra = pipeline.microstructure_signals(
+                m.returns,
+                m.abs_returns,
+                m.volume,
+                self.config['illiquidity_window'],
+                self.config['illiquidity_ref_window'],
+                self.config['tail_risk_window'],
+                with_illiq,
+                with_tail,
+            )
+            columns = {}
+            if with_illiq:
+                columns['illiquidity'] = illiq
+                columns['illiquidity_ratio'] = ratio
+            if with_tail:
+                columns['tail_risk_asym'] = tra
+            return pd.DataFrame(columns, index=m.index)
         
-        signals = pd.DataFrame(index=data.index)
-        signals['illiquidity'] = self.amihud_illiquidity(returns, data['volume'])
-        signals['illiquidity_ratio'] = self.illiquidity_ratio(returns, data['volume'])
-        signals['tail_risk_asym'] = self.tail_risk_asymmetry(returns)
+        returns = m.series(m.returns)
+        volume = m.series(m.volume)
+        signals = pd.DataFrame(index=m.index)
+        if with_illiq:
+            signals['illiquidity'] = self.amihud_illiquidity(returns, volume)
+            signals['illiquidity_ratio'] = self.illiquidity_ratio(returns, volume)
+        if with_tail:
+            signals['tail_risk_asym'] = self.tail_risk_asymmetry(returns)
         
         return signals
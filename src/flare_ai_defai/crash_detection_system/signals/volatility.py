@@ -6,6 +6,10 @@ All functions are deterministic and unit-testable.
 import numpy as np
 import pandas as pd
 
+from .._kernels import NUMBA_AVAILABLE
+from .._kernels import ewm, moments, pipeline, rolling
+from ..types import MarketArrays
+
 
 class VolatilitySignals:
     """Calculate volatility-based crash detection signals"""
@@ -31,6 +35,11 @@ class VolatilitySignals:
         
         window = int(window) if window is not None else 20
         ann_factor = np.sqrt(self.config['annualization_factor'])
+        if NUMBA_AVAILABLE:
+            std = rolling.rolling_std(
+                returns.to_numpy(dtype=np.float64), window, window
+            )
+            return pd.Series(std, index=returns.index) * ann_factor
         rv = returns.rolling(window).std() * ann_factor
         return rv
     
@@ -50,7 +59,13 @@ class VolatilitySignals:
         long_window = self.config['vol_regime_long']
         
         rv_short = self.realized_volatility(returns, short_window)
-        rv_long = rv_short.ewm(span=long_window).mean()
+        if NUMBA_AVAILABLE:
+            rv_long = pd.Series(
+                ewm.ewm_mean(rv_short.to_numpy(dtype=np.float64), long_window),
+                index=rv_short.index,
+            )
+        else:
+            rv_long = rv_short.ewm(span=long_window).mean()
         
         regime = rv_short / rv_long
         return regime
@@ -71,25 +86,52 @@ class VolatilitySignals:
         lookback = self.config['vov_lookback']
         
         rv = self.realized_volatility(returns, window=24)
+        if NUMBA_AVAILABLE:
+            rv_arr = rv.to_numpy(dtype=np.float64)
+            vov = (
+                rolling.rolling_std(rv_arr, lookback, lookback)
+                / moments.rolling_mean(rv_arr, lookback, lookback)
+            )
+            return pd.Series(vov, index=rv.index)
         vov = rv.rolling(lookback).std() / rv.rolling(lookback).mean()
         
         return vov
     
-    def compute_all(self, data: pd.DataFrame) -> pd.DataFrame:
+    def compute_all(
+        self, m: MarketArrays, needed: set[str] | None = None
+    ) -> pd.DataFrame:
         """
         Compute all volatility signals.
         
         Args:
-            data: OHLCV DataFrame
+            m: Close/volume/returns arrays of the OHLCV window
+            needed: Signal columns the caller uses (None = all); vol_of_vol
+                is skipped when absent
         
         Returns:
             DataFrame with volatility signals
         """
-        returns = pd.Series(np.log(data['close'] / data['close'].shift(1)), index=data.index)
-        
-        signals = pd.DataFrame(index=data.index)
+        with_vov = needed is None or 'vol_of_vol' in needed
+        if NUMBA_AVAILABLE:
+            rv, regime, vov = pipeline.volatility_signals(
+                m.returns,
+                int(self.config.get('rv_window', 20)),
+                self.config['vol_regime_short'],
+                self.config['vol_regime_long'],
+                self.config['vov_lookback'],
+                np.sqrt(self.config['annualization_factor']),
+                with_vov,
+            )
+            columns = {'realized_vol': rv, 'vol_regime': regime}
+            if with_vov:
+                columns['vol_of_vol'] = vov
+            return pd.DataFrame(columns, index=m.index)
+        
+        returns = m.series(m.returns)
+        signals = pd.DataFrame(index=m.index)
         signals['realized_vol'] = self.realized_volatility(returns)
         signals['vol_regime'] = self.vol_regime(returns)
-        signals['vol_of_vol'] = self.vol_of_vol(returns)
+        if with_vov:
+            signals['vol_of_vol'] = self.vol_of_vol(returns)
         
         return signals
@@ -2,9 +2,13 @@
 Type definitions for the risk analysis system.
 All user-facing types and configurations are deterministic.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from datetime import datetime
+from types import MappingProxyType
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
 
 
 class RiskAppetite(str, Enum):
@@ -14,7 +18,26 @@ class RiskAppetite(str, Enum):
     HIGH = "high"
 
 
-@dataclass
+# Fixed order of the crash-model inputs; RiskProfile.weight_vec follows it
+SIGNAL_ORDER = (
+    'regime_prob',
+    'lcvi',
+    'evt_tail',
+    'vol_regime',
+    'dd_velocity',
+    'funding_stress',
+    'illiquidity',
+)
+
+
+def weight_vector(weights: dict[str, float]) -> np.ndarray:
+    """Weights aligned to SIGNAL_ORDER (0.0 for unweighted signals), read-only."""
+    vec = np.array([weights.get(name, 0.0) for name in SIGNAL_ORDER], dtype=np.float64)
+    vec.setflags(write=False)
+    return vec
+
+
+@dataclass(frozen=True)
 class RiskProfile:
     """
     Deterministic mapping from user risk appetite to trading parameters.
@@ -28,6 +51,7 @@ class RiskProfile:
         max_exposure_normal: Maximum position size in normal conditions (1.0 = 100%)
         max_exposure_stress: Maximum position size in high-risk conditions
         weights: Signal importance weights for crash probability model
+        weight_vec: weights as an array in SIGNAL_ORDER (derived)
     """
     name: str
     crash_cutoff_high: float
@@ -35,10 +59,15 @@ class RiskProfile:
     max_exposure_normal: float
     max_exposure_stress: float
     weights: dict[str, float]
+    weight_vec: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'weight_vec', weight_vector(self.weights))
 
 
-# Predefined risk profiles - DETERMINISTIC, NO LLM
-RISK_PROFILES = {
+# Predefined risk profiles - DETERMINISTIC, NO LLM. Read-only; RiskAppetite
+# is a str enum hashing like its value, so "low" etc. also index it
+RISK_PROFILES = MappingProxyType({
     RiskAppetite.LOW: RiskProfile(
         name="low",
         crash_cutoff_high=0.5,
@@ -85,7 +114,7 @@ RISK_PROFILES = {
             'illiquidity': 0.10,
         }
     ),
-}
+})
 
 
 @dataclass
@@ -107,7 +136,14 @@ class RiskAnalysisResult:
     recommended_exposure: float
     exposure_rationale: str
     current_price: float
-    analysis_timestamp: str
+    analysis_timestamp_ns: int
+
+    @property
+    def analysis_timestamp(self) -> str:
+        """UTC ISO-8601 time of the analysis, formatted on demand."""
+        return datetime.fromtimestamp(
+            self.analysis_timestamp_ns / 1e9, tz=timezone.utc
+        ).isoformat()
 
 
 @dataclass
@@ -120,3 +156,42 @@ class UserIntent:
     risk_appetite: RiskAppetite
     horizon_hours: int
     specific_concerns: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class MarketArrays:
+    """
+    Struct-of-arrays view of one OHLCV window, built once per evaluation
+    and shared by every signal family.
+
+    Attributes:
+        index: Bar timestamps
+        close: Close prices (float64, contiguous)
+        volume: Traded volume (float64, contiguous)
+        returns: Log returns of close; the first bar is NaN
+        abs_returns: |returns|
+    """
+    index: pd.Index
+    close: np.ndarray
+    volume: np.ndarray
+    returns: np.ndarray
+    abs_returns: np.ndarray
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "MarketArrays":
+        close = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
+        returns = np.empty_like(close)
+        if len(close):
+            returns[0] = np.nan
+            np.log(close[1:] / close[:-1], out=returns[1:])
+        return cls(
+            index=data.index,
+            close=close,
+            volume=np.ascontiguousarray(data['volume'].to_numpy(dtype=np.float64)),
+            returns=returns,
+            abs_returns=np.abs(returns),
+        )
+
+    def series(self, values: np.ndarray) -> pd.Series:
+        """Wrap one of the arrays as a Series on the bar index."""
+        return pd.Series(values, index=self.index)
@@ -12,3 +12,7 @@ class AttestationError(FlareAiError):
 
 class RoutingError(FlareAiError):
     """Raised when semantic routing fails"""
+
+
+class CircuitOpenError(FlareAiError):
+    """Raised when a call is rejected because its circuit breaker is open"""
@@ -1,13 +1,32 @@
 from __future__ import annotations
 
+import functools
+import threading
 from dataclasses import dataclass
-from typing import Final, Tuple
+from typing import TYPE_CHECKING, Final, Tuple, TypeVar
 
+from cachetools import TTLCache, cached
 from web3 import Web3
-from flare_ai_defai.settings import settings
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from flare_ai_defai.settings import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from web3.contract import Contract
+
+T = TypeVar("T")
 
 FLARE_CONTRACT_REGISTRY: Final[str] = "0xaD67FE66660Fb8dFE9d6b1b4240d8650e30F6019"
 BTC_USD_FEED_ID_HEX: Final[str] = "0x014254432f55534400000000000000000000000000"  # BTC/USD bytes21
+_BTC_USD_FEED_ID: Final[bytes] = bytes.fromhex(BTC_USD_FEED_ID_HEX[2:])
+
+# feed_id -> (decimals, 10.0 ** decimals); decimals are fixed per feed, so
+# the divisor is rebuilt only if a feed ever reports a different value
+_DIVISOR_CACHE: dict[bytes, tuple[int, float]] = {}
+
+# Registry entries only change on protocol upgrades
+REGISTRY_TTL_SECONDS: Final[int] = 3600
 
 # Real FlareContractRegistry methods (these are what you can call off-chain)
 FLARE_CONTRACT_REGISTRY_ABI = [
@@ -42,7 +61,18 @@ TEST_FTSO_V2_ABI = [
             {"name": "_decimals", "type": "int8"},
             {"name": "_timestamp", "type": "uint64"},
         ],
-    }
+    },
+    {
+        "name": "getFeedsById",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "_feedIds", "type": "bytes21[]"}],
+        "outputs": [
+            {"name": "_values", "type": "uint256[]"},
+            {"name": "_decimals", "type": "int8[]"},
+            {"name": "_timestamp", "type": "uint64"},
+        ],
+    },
 ]
 
 @dataclass(frozen=True)
@@ -52,6 +82,14 @@ class FlarePrice:
     timestamp: int  # unix seconds
 
 
+def _to_price(feed_id: bytes, value: int, decimals: int, ts: int) -> FlarePrice:
+    d = int(decimals)
+    cached = _DIVISOR_CACHE.get(feed_id)
+    if cached is None or cached[0] != d:
+        cached = _DIVISOR_CACHE[feed_id] = (d, 10.0 ** d)
+    return FlarePrice(price=value / cached[1], decimals=d, timestamp=int(ts))
+
+
 def _resolve_ftso_v2_address(registry) -> str:
     """
     Prefer TestFtsoV2 on Coston2 (dev), fallback to FtsoV2 if not present.
@@ -73,26 +111,75 @@ def _resolve_ftso_v2_address(registry) -> str:
     raise RuntimeError("Could not find an FtsoV2/TestFtsoV2 address in FlareContractRegistry.getAllContracts().")
 
 
-def get_btc_usd_price() -> FlarePrice:
-    w3 = Web3(Web3.HTTPProvider(settings.web3_provider_url))
+@functools.lru_cache(maxsize=1)
+def _get_w3() -> Web3:
+    """One provider (and its HTTP session) for every price read."""
+    url = get_settings().web3_provider_url
+    w3 = Web3(Web3.HTTPProvider(url))
     if not w3.is_connected():
-        raise RuntimeError(f"Web3 not connected to RPC: {settings.web3_provider_url}")
+        raise RuntimeError(f"Web3 not connected to RPC: {url}")
+    return w3
 
+
+@cached(
+    TTLCache(maxsize=1, ttl=REGISTRY_TTL_SECONDS),
+    lock=threading.Lock(),
+)
+def _get_ftso_contract(registry_address: str = FLARE_CONTRACT_REGISTRY) -> Contract:
+    """
+    FtsoV2 contract, resolved through the registry at most once an hour.
+
+    Keyed on the registry address, so getAllContracts is fetched and decoded
+    once per TTL instead of once per price read.
+    """
+    w3 = _get_w3()
     registry = w3.eth.contract(
-        address=Web3.to_checksum_address(FLARE_CONTRACT_REGISTRY),
+        address=Web3.to_checksum_address(registry_address),
         abi=FLARE_CONTRACT_REGISTRY_ABI,
     )
+    return w3.eth.contract(
+        address=Web3.to_checksum_address(_resolve_ftso_v2_address(registry)),
+        abi=TEST_FTSO_V2_ABI,
+    )
 
-    ftso_v2_addr = _resolve_ftso_v2_address(registry)
 
-    ftso = w3.eth.contract(
-        address=Web3.to_checksum_address(ftso_v2_addr),
-        abi=TEST_FTSO_V2_ABI,
+def _read_ftso(read: Callable[[Contract], T]) -> T:
+    """
+    Run read(contract); if the call reverts or returns nothing, re-resolve
+    the contract and retry once.
+
+    Those are what a call to a contract that moved in an upgrade looks
+    like, which the cached address would otherwise hide until the TTL
+    expires. RPC and network errors propagate unchanged.
+    """
+    try:
+        return read(_get_ftso_contract())
+    except (ContractLogicError, BadFunctionCallOutput):
+        _get_ftso_contract.cache_clear()
+        return read(_get_ftso_contract())
+
+
+def get_feed_prices(feed_ids: list[bytes]) -> list[FlarePrice]:
+    """
+    Read several FTSO feeds in one eth_call via FtsoV2.getFeedsById.
+
+    All feeds share the block's timestamp. Prices come back in the order of
+    feed_ids.
+    """
+    feed_ids = list(feed_ids)
+    values, decimals, ts = _read_ftso(
+        lambda c: c.functions.getFeedsById(feed_ids).call()
     )
 
-    feed_id = bytes.fromhex(BTC_USD_FEED_ID_HEX[2:])  # bytes21
-    value, decimals, ts = ftso.functions.getFeedById(feed_id).call()
+    return [
+        _to_price(f, v, d, ts)
+        for f, v, d in zip(feed_ids, values, decimals, strict=True)
+    ]
 
-    d = int(decimals)
-    px = float(value) / (10 ** d)
-    return FlarePrice(price=px, decimals=d, timestamp=int(ts))
+
+def get_btc_usd_price() -> FlarePrice:
+    value, decimals, ts = _read_ftso(
+        lambda c: c.functions.getFeedById(_BTC_USD_FEED_ID).call()
+    )
+
+    return _to_price(_BTC_USD_FEED_ID, value, decimals, ts)
@@ -24,13 +24,13 @@ from flare_ai_defai import (
     PromptService,
     Vtpm,
 )
-from flare_ai_defai.settings import settings
-if settings.simulate_ai:
+from flare_ai_defai.settings import get_settings
+if get_settings().simulate_ai:
     ai = DummyAIProvider()
 else:
     ai = GeminiProvider(
-        api_key=settings.gemini_api_key,
-        model=settings.gemini_model,
+        api_key=get_settings().gemini_api_key,
+        model=get_settings().gemini_model,
     )
 
 
@@ -63,6 +63,7 @@ def create_app() -> FastAPI:
         - web3_provider_url: URL for Web3 provider
         - simulate_attestation: Boolean flag for attestation simulation
     """
+    settings = get_settings()
     if settings.simulate_ai:
         ai = GeminiProvider(
             api_key=settings.gemini_api_key,
@@ -0,0 +1,212 @@
+"""
+Append-only Parquet store for BTC klines.
+
+The store is a directory of Parquet part files, one per write, named by the
+first open_time they contain so lexical order equals time order. Appending
+new candles writes only the new rows. Once the small appended parts pile up
+they are compacted into one; the first (backfill) part is never rewritten.
+
+Only closed candles are stored: the still-open last candle keeps changing
+until its close_time, and append-only parts could never correct it.
+"""
+from __future__ import annotations
+
+import asyncio
+import shutil
+import time
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from flare_ai_defai.market_data.binance import (
+    backfill_history_async,
+    cast_klines,
+    fetch_klines,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Binance returns at most this many klines per request
+_PAGE_LIMIT = 1000
+
+# Parts allowed before compaction: a day of 15m ticks
+_MAX_PARTS = 96
+
+
+def _part_path(store: Path, df: pd.DataFrame) -> Path:
+    return store / f"part-{int(df['open_time'].iloc[0]):013d}.parquet"
+
+
+def _closed(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop candles whose close_time has not passed yet."""
+    return df[df["close_time"].astype("int64") < time.time_ns() // 1_000_000]
+
+
+def _parts(store: Path) -> list[Path]:
+    return sorted(store.glob("part-*.parquet"))
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def write_candles(store: Path, df: pd.DataFrame) -> int:
+    """
+    Replace the whole store with df (used by backfill / migration).
+
+    The new store is written to a sibling temp directory and renamed into
+    place, so a failed write leaves the existing history untouched. With no
+    closed candles to write the store is left as it is.
+
+    Returns:
+        Number of rows written
+    """
+    candles = _closed(df)
+    if candles.empty:
+        return 0
+    candles = cast_klines(candles)
+
+    tmp = store.with_name(f".{store.name}.tmp")
+    _remove(tmp)
+    tmp.mkdir(parents=True)
+    try:
+        candles.to_parquet(
+            _part_path(tmp, candles), compression="snappy", index=False
+        )
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    # rename(2) cannot replace a non-empty directory: move the old store
+    # aside first and delete it only once the new one is in place
+    old = store.with_name(f".{store.name}.old")
+    if store.exists():
+        _remove(old)
+        store.replace(old)
+    tmp.replace(store)
+    _remove(old)
+    return len(candles)
+
+
+def append_candles(store: Path, new: pd.DataFrame) -> int:
+    """
+    Append candles newer than the last stored open_time as a new part file.
+
+    An empty or missing store gets every closed candle as its first part.
+
+    Returns:
+        Number of rows appended
+    """
+    new = _closed(new[new["open_time"].astype("int64") > last_open_time(store)])
+    if new.empty:
+        return 0
+    new = cast_klines(new)
+    store.mkdir(parents=True, exist_ok=True)
+    new.to_parquet(_part_path(store, new), compression="snappy", index=False)
+    return len(new)
+
+
+def last_open_time(store: Path) -> int:
+    """
+    Latest open_time in the store, or -1 if it has no parts yet.
+
+    Part files sort by their first open_time, so only the last part's
+    open_time column needs to be read.
+    """
+    parts = _parts(store)
+    if not parts:
+        return -1
+    last_part = parts[-1]
+    times = pd.read_parquet(last_part, columns=["open_time"], engine="pyarrow")
+    return int(times["open_time"].max())
+
+
+def update_store(
+    store: Path,
+    symbol: str = "BTCUSDT",
+    interval: str = "15m",
+) -> int:
+    """
+    Append every closed candle newer than the store, backfilling if empty.
+
+    A missing store is filled once with the concurrent full-history fetch;
+    afterwards only candles after the last stored open_time are requested,
+    page by page until Binance returns a short page.
+
+    Returns:
+        Number of rows written
+    """
+    if not any(store.glob("part-*.parquet")):
+        return write_candles(
+            store, asyncio.run(backfill_history_async(symbol, interval))
+        )
+
+    appended = 0
+    while True:
+        new = fetch_klines(
+            symbol, interval, last_open_time(store) + 1, limit=_PAGE_LIMIT
+        )
+        n = append_candles(store, new)
+        appended += n
+        if n == 0 or len(new) < _PAGE_LIMIT:
+            break
+
+    compact_store(store)
+    return appended
+
+
+def compact_store(store: Path, max_parts: int = _MAX_PARTS) -> bool:
+    """
+    Merge every part after the first into one once there are too many.
+
+    Each 15-minute update adds a part of a few rows, so without this a
+    year leaves ~35k files for every read to open. The first part holds
+    the backfilled history and is left alone; only rows appended since
+    are rewritten.
+
+    The merged part takes the name of the first part it replaces and is
+    renamed over it, then the other merged parts are deleted. A crash in
+    between leaves rows in two parts, which readers de-duplicate and the
+    next compaction drops.
+
+    Returns:
+        Whether the store was compacted
+    """
+    parts = _parts(store)
+    if len(parts) <= max_parts:
+        return False
+
+    tail = parts[1:]
+    merged = (
+        pd.concat(
+            [pd.read_parquet(p, engine="pyarrow") for p in tail],
+            ignore_index=True,
+        )
+        .drop_duplicates("open_time", keep="last")
+        .sort_values("open_time")
+    )
+    tmp = store / f".{tail[0].name}.tmp"
+    merged.to_parquet(tmp, compression="snappy", index=False)
+    tmp.replace(tail[0])
+    for part in tail[1:]:
+        part.unlink()
+    return True
+
+
+def load_or_backfill(
+    store: Path,
+    symbol: str = "BTCUSDT",
+    interval: str = "15m",
+) -> pd.DataFrame:
+    """
+    Bring the store up to date and return every stored candle.
+
+    Cold start downloads the history once; later runs fetch only the
+    candles closed since the last run.
+    """
+    update_store(store, symbol, interval)
+    return pd.read_parquet(store, engine="pyarrow")
@@ -0,0 +1,161 @@
+"""
+Resilience helpers for calls to external services.
+
+CircuitBreaker stops a degraded dependency (Gemini, the Flare RPC) from
+tying up a worker thread per request: after a run of consecutive failures
+calls fail fast until a cooldown has passed, then a single probe decides
+whether to close the circuit again.
+
+Retry re-issues idempotent calls that failed with a transient error, using
+capped exponential backoff with full jitter.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal, TypeVar
+
+import structlog
+
+from flare_ai_defai.exceptions import CircuitOpenError
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for async calls.
+
+    Attributes:
+        name (str): Dependency name used in logs and errors
+        fail_max (int): Consecutive failures that open the circuit
+        reset_timeout (float): Seconds to stay open before allowing a probe
+        exclude (tuple[type[BaseException], ...]): Exceptions that are
+            errors of the request, not of the dependency, and do not count
+        state (str): "closed", "open" or "half_open"
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = 5,
+        reset_timeout: float = 30.0,
+        exclude: tuple[type[BaseException], ...] = (),
+    ) -> None:
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.exclude = exclude
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self.logger = logger.bind(breaker=name)
+
+    def _before_call(self) -> None:
+        if self.state == "closed":
+            return
+        if (
+            self.state == "open"
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            # Let exactly one probe through; others keep failing fast
+            self.state = "half_open"
+            return
+        msg = f"{self.name} is temporarily unavailable (circuit open)"
+        raise CircuitOpenError(msg)
+
+    def _on_success(self) -> None:
+        if self.state != "closed":
+            self.logger.info("circuit_closed")
+        self.state = "closed"
+        self._failures = 0
+
+    def _on_failure(self) -> None:
+        self._failures += 1
+        if self.state == "half_open" or self._failures >= self.fail_max:
+            if self.state != "open":
+                self.logger.warning("circuit_opened", failures=self._failures)
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def _on_abort(self) -> None:
+        # A probe that ended without a result (e.g. cancelled) proved
+        # nothing: reopen so another probe is allowed after the cooldown
+        if self.state == "half_open":
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    async def call(
+        self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Await fn(*args, **kwargs) through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self._before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except self.exclude:
+            self._on_success()
+            raise
+        except Exception:
+            self._on_failure()
+            raise
+        except BaseException:
+            self._on_abort()
+            raise
+        self._on_success()
+        return result
+
+
+class Retry:
+    """
+    Retry policy for idempotent async calls.
+
+    Attributes:
+        attempts (int): Total attempts, including the first
+        base_delay (float): Backoff scale in seconds
+        max_delay (float): Cap on a single backoff in seconds
+        retry_on (tuple[type[BaseException], ...]): Transient exceptions
+    """
+
+    def __init__(
+        self,
+        retry_on: tuple[type[BaseException], ...],
+        attempts: int = 3,
+        base_delay: float = 0.2,
+        max_delay: float = 2.0,
+    ) -> None:
+        if attempts < 1:
+            msg = "attempts must be >= 1"
+            raise ValueError(msg)
+        self.retry_on = retry_on
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    async def call(
+        self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Await fn(*args, **kwargs), retrying on the transient exceptions.
+
+        The last failure is re-raised once attempts are exhausted.
+        """
+        for attempt in range(1, self.attempts):
+            try:
+                return await fn(*args, **kwargs)
+            except self.retry_on as e:
+                delay = random.uniform(  # noqa: S311 - jitter, not crypto
+                    0, min(self.max_delay, self.base_delay * 2**attempt)
+                )
+                logger.debug(
+                    "retrying_call", attempt=attempt, delay=delay, error=str(e)
+                )
+                await asyncio.sleep(delay)
+        return await fn(*args, **kwargs)
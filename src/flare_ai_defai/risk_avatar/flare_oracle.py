@@ -1,7 +1,15 @@
+import functools
+import threading
+
+from cachetools import TTLCache, cached
 from web3 import Web3
 
 FLARE_RPC = "https://coston2-api.flare.network/ext/C/rpc"
 
+# FTSO prices update every ~90 s on Coston2; faster polls would read the
+# same value back from the chain, so they are answered from memory
+PRICE_TTL_SECONDS = 15
+
 FTSO_REGISTRY_ADDRESS = Web3.to_checksum_address(
     "0x1000000000000000000000000000000000000003"
 )
@@ -21,16 +29,24 @@ FTSO_REGISTRY_ABI = [
     }
 ]
 
-def get_btc_price() -> tuple[float, int]:
+@functools.lru_cache(maxsize=1)
+def _get_registry():
+    # Built once: the provider keeps its HTTP session between ticks
     w3 = Web3(Web3.HTTPProvider(FLARE_RPC))
-    registry = w3.eth.contract(
+    return w3.eth.contract(
         address=FTSO_REGISTRY_ADDRESS,
         abi=FTSO_REGISTRY_ABI,
     )
 
-    price, timestamp, decimals = registry.functions.getCurrentPriceWithDecimals(
+
+@cached(
+    TTLCache(maxsize=1, ttl=PRICE_TTL_SECONDS),
+    key=lambda: "BTC/USD",
+    lock=threading.Lock(),
+)
+def get_btc_price() -> tuple[float, int]:
+    price, timestamp, decimals = _get_registry().functions.getCurrentPriceWithDecimals(
         "BTC/USD"
     ).call()
 
     return price / (10 ** decimals), timestamp
-
@@ -1,5 +1,3 @@
-import time
-from collections import deque
 import numpy as np
 
 from flare_ai_defai.risk_avatar.models import (
@@ -13,8 +11,15 @@ from flare_ai_defai.risk_avatar.flare_oracle import get_btc_price
 
 class RiskAvatarManager:
     def __init__(self, window: int = 30):
-        self.prices = deque(maxlen=window)
-        self.timestamps = deque(maxlen=window)
+        # Preallocated ring buffers: slot _head is overwritten next, the
+        # first _n slots are filled
+        self._window = window
+        self._prices = np.empty(window, dtype=np.float64)
+        self._timestamps = np.empty(window, dtype=np.int64)
+        self._head = 0
+        self._n = 0
+        # Window max, kept up to date on push
+        self._peak = -np.inf
         self._prev_drawdown = 0.0
 
         self.profile = RiskProfile(
@@ -29,16 +34,45 @@ class RiskAvatarManager:
             stress_level=20.0,
             risk_mode="calm",
         )
+        # Refilled by update(); one instance for the manager's lifetime
+        self._market = MarketState(0.0, 0.0, 0.0, 0.0, 0)
+
+    def _push(self, price: float, ts: int) -> None:
+        evicted = self._prices[self._head] if self._n == self._window else -np.inf
+        self._prices[self._head] = price
+        self._timestamps[self._head] = ts
+        self._head = (self._head + 1) % self._window
+        self._n = min(self._n + 1, self._window)
+        if price >= self._peak:
+            self._peak = price
+        elif evicted == self._peak:
+            # The max left the window; rescan (the buffer is full here)
+            self._peak = float(self._prices.max())
+
+    def _ordered(self, buf: np.ndarray) -> np.ndarray:
+        if self._n < self._window:
+            return buf[:self._n]
+        return np.concatenate((buf[self._head:], buf[:self._head]))
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Buffered prices, oldest first."""
+        return self._ordered(self._prices)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Oracle timestamps of the buffered prices, oldest first."""
+        return self._ordered(self._timestamps)
 
     def _compute_features(self):
-        if len(self.prices) < 2:
+        if self._n < 2:
             return 0.0, 0.0, 0.0
 
-        prices = np.array(self.prices)
+        prices = self.prices
         returns = np.diff(prices) / prices[:-1]
 
         volatility = np.std(returns)
-        peak = np.max(prices)
+        peak = self._peak
         drawdown = (peak - prices[-1]) / peak
 
         drawdown_speed = max(0.0, drawdown - getattr(self, "_prev_drawdown", 0.0))
@@ -49,23 +83,19 @@ class RiskAvatarManager:
     def update(self) -> AvatarState:
         price, ts = get_btc_price()
 
-        self.prices.append(price)
-        self.timestamps.append(ts)
+        self._push(price, ts)
 
         volatility, drawdown, drawdown_speed = self._compute_features()
 
-        market = MarketState(
-            price=price,
-            volatility=float(volatility),
-            drawdown=float(drawdown),
-            drawdown_speed=float(drawdown_speed),
-            timestamp=int(time.time()),
-        )
+        # The oracle timestamp is the time of the observation
+        market = self._market
+        market.price = price
+        market.volatility = float(volatility)
+        market.drawdown = float(drawdown)
+        market.drawdown_speed = float(drawdown_speed)
+        market.timestamp = int(ts)
 
-        self.avatar = update_avatar_state(
-            self.profile,
-            market,
-            self.avatar,
-        )
+        # Mutates self.avatar in place
+        update_avatar_state(self.profile, market, self.avatar)
 
         return self.avatar
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskProfile:
     risk_level: int           # 0–100
     max_drawdown: float
@@ -10,7 +10,8 @@ class RiskProfile:
     reaction_speed: float
 
 
-@dataclass
+# Mutable: RiskAvatarManager refills one instance every tick
+@dataclass(slots=True)
 class MarketState:
     price: float
     volatility: float
@@ -19,7 +20,8 @@ class MarketState:
     timestamp: int
 
 
-@dataclass
+# Mutable: update_avatar_state adjusts it in place every tick
+@dataclass(slots=True)
 class AvatarState:
     stress_level: float
     risk_mode: str  # "calm" | "alert" | "panic"
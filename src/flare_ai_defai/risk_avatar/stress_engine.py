@@ -1,9 +1,27 @@
+import math
+
+import numpy as np
+
+from flare_ai_defai.crash_detection_system._kernels import njit
 from flare_ai_defai.risk_avatar.models import (
-    RiskProfile,
-    MarketState,
     AvatarState,
+    MarketState,
+    RiskProfile,
 )
 
+# risk_mode for each code returned by update_avatar_state_batch
+CALM, ALERT, PANIC = 0, 1, 2
+RISK_MODES = ("calm", "alert", "panic")
+
+# Stress is clamped to [0, MAX_STRESS]; the mode turns alert at
+# ALERT_STRESS and panic at PANIC_STRESS
+MAX_STRESS = 100.0
+ALERT_STRESS = 30.0
+PANIC_STRESS = 70.0
+
+# Stress shed per update in each mode, indexed by mode code
+RECOVERY = (1.0, 0.5, 0.15)
+
 
 def update_avatar_state(
     profile: RiskProfile,
@@ -14,8 +32,10 @@ def update_avatar_state(
     Update the avatar stress level and risk mode based on market conditions.
     """
 
+    # v ** 1.5 as v * sqrt(v): a correctly rounded sqrt instead of a pow
+    v = market.volatility
     shock_stress = (
-        (market.volatility ** 1.5) * 180 * profile.stress_sensitivity
+        (v * math.sqrt(v)) * 180 * profile.stress_sensitivity
         + (market.drawdown_speed ** 1.3) * 500
     )
 
@@ -25,22 +45,91 @@ def update_avatar_state(
 
     avatar.stress_level += incoming_stress * profile.reaction_speed * 0.01
 
-    if avatar.risk_mode == "panic":
-        recovery = 0.15
-    elif avatar.risk_mode == "alert":
-        recovery = 0.5
+    if avatar.risk_mode == RISK_MODES[PANIC]:
+        recovery = RECOVERY[PANIC]
+    elif avatar.risk_mode == RISK_MODES[ALERT]:
+        recovery = RECOVERY[ALERT]
     else:
-        recovery = 1.0
+        recovery = RECOVERY[CALM]
 
     avatar.stress_level -= recovery
 
-    avatar.stress_level = max(0.0, min(100.0, avatar.stress_level))
+    avatar.stress_level = max(0.0, min(MAX_STRESS, avatar.stress_level))
 
-    if avatar.stress_level < 30:
-        avatar.risk_mode = "calm"
-    elif avatar.stress_level < 70:
-        avatar.risk_mode = "alert"
+    if avatar.stress_level < ALERT_STRESS:
+        avatar.risk_mode = RISK_MODES[CALM]
+    elif avatar.stress_level < PANIC_STRESS:
+        avatar.risk_mode = RISK_MODES[ALERT]
     else:
-        avatar.risk_mode = "panic"
+        avatar.risk_mode = RISK_MODES[PANIC]
 
     return avatar
+
+
+@njit(cache=True)
+def _stress_path(
+    volatility: np.ndarray,
+    drawdown: np.ndarray,
+    drawdown_speed: np.ndarray,
+    sensitivity: float,
+    reaction_speed: float,
+    stress: float,
+    mode: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    # Carried dependency (each step's recovery depends on the last mode), so
+    # the whole update runs as one sequential loop; arithmetic and libm pow
+    # calls mirror update_avatar_state
+    n = volatility.shape[0]
+    stress_out = np.empty(n, dtype=np.float64)
+    mode_out = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        v = volatility[i]
+        shock_stress = (
+            (v * np.sqrt(v)) * 180 * sensitivity
+            + (drawdown_speed[i] ** 1.3) * 500
+        )
+        pain_stress = (drawdown[i] ** 1.3) * 300
+        stress += (shock_stress + pain_stress) * reaction_speed * 0.01
+
+        stress -= RECOVERY[mode]
+
+        # max(0.0, min(MAX_STRESS, stress)), NaN included
+        if not stress < MAX_STRESS:
+            stress = MAX_STRESS
+        if not stress > 0.0:
+            stress = 0.0
+
+        if stress < ALERT_STRESS:
+            mode = CALM
+        elif stress < PANIC_STRESS:
+            mode = ALERT
+        else:
+            mode = PANIC
+
+        stress_out[i] = stress
+        mode_out[i] = mode
+    return stress_out, mode_out
+
+
+def update_avatar_state_batch(
+    profile: RiskProfile,
+    volatility: np.ndarray,
+    drawdown: np.ndarray,
+    drawdown_speed: np.ndarray,
+    avatar: AvatarState,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run update_avatar_state over a whole series of market states.
+
+    Returns:
+        (stress_level, risk_mode code) after each step; codes index RISK_MODES
+    """
+    return _stress_path(
+        np.asarray(volatility, dtype=np.float64),
+        np.asarray(drawdown, dtype=np.float64),
+        np.asarray(drawdown_speed, dtype=np.float64),
+        float(profile.stress_sensitivity),
+        float(profile.reaction_speed),
+        float(avatar.stress_level),
+        RISK_MODES.index(avatar.risk_mode),
+    )
@@ -1,3 +1,6 @@
+import functools
+import logging
+
 import structlog
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -7,6 +10,7 @@ class Settings(BaseSettings):
     # Flags
     simulate_attestation: bool = False
     simulate_ai: bool = False
+    use_arrow_io: bool = True
 
     # CORS
     cors_origins: list[str] = ["*"]
@@ -14,6 +18,7 @@ class Settings(BaseSettings):
     # Gemini
     gemini_api_key: str = ""
     gemini_model: str = "gemini-1.5-flash"
+    gemini_embedding_model: str = "models/text-embedding-004"
 
     # API
     api_version: str = "v1"
@@ -25,6 +30,12 @@ class Settings(BaseSettings):
     # Snapshot JSON
     latest_update_path: str = "shared/latest_update.json"
 
+    # Risk data: parse only the last N candle CSV rows (0 = full history)
+    csv_tail_rows: int = 0
+    # Re-evaluate every risk profile in the background every N seconds
+    # (0 = off, analyze computes on the request thread)
+    risk_refresh_seconds: float = 0.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -39,5 +50,10 @@ def _redact_settings(d: dict) -> dict:
             redacted[k] = "***REDACTED***"
     return redacted
 
-settings = Settings()
-logger.debug("settings", settings=_redact_settings(settings.model_dump()))
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Settings parsed from the environment on first use, then shared."""
+    settings = Settings()
+    if logger.is_enabled_for(logging.DEBUG):
+        logger.debug("settings", settings=_redact_settings(settings.model_dump()))
+    return settings
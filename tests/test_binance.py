@@ -0,0 +1,43 @@
+import asyncio
+
+import httpx
+
+from flare_ai_defai.market_data.binance import _fetch_klines_async
+
+ROW = [0, "1", "2", "0.5", "1.5", "10", 899_999, "15", 3, "5", "7", "0"]
+
+
+def _fetch(transport: httpx.MockTransport) -> list[list]:
+    async def scenario() -> list[list]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await _fetch_klines_async(client, asyncio.Semaphore(1), {})
+
+    return asyncio.run(scenario())
+
+
+def test_http_date_retry_after_is_honoured() -> None:
+    responses = iter(
+        [
+            httpx.Response(
+                429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            ),
+            httpx.Response(200, json=[ROW]),
+        ]
+    )
+
+    assert _fetch(httpx.MockTransport(lambda _: next(responses))) == [ROW]
+
+
+def test_transport_errors_are_retried() -> None:
+    failed = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal failed
+        if not failed:
+            failed = True
+            reset = "connection reset"
+            raise httpx.ConnectError(reset, request=request)
+        return httpx.Response(200, json=[ROW])
+
+    assert _fetch(httpx.MockTransport(handler)) == [ROW]
+    assert failed
@@ -0,0 +1,176 @@
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from flare_ai_defai.crash_detection_system._kernels import (
+    NUMBA_AVAILABLE,
+    ewm,
+    gpd,
+    moments,
+    rank,
+    rolling,
+)
+from flare_ai_defai.crash_detection_system.signals.leverage import LeverageSignals
+from flare_ai_defai.crash_detection_system.signals.microstructure import (
+    MicrostructureSignals,
+)
+from flare_ai_defai.crash_detection_system.signals.volatility import VolatilitySignals
+from flare_ai_defai.crash_detection_system.types import MarketArrays
+
+pytestmark = pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+
+
+@pytest.fixture
+def series() -> pd.Series:
+    rng = np.random.default_rng(7)
+    x = rng.normal(size=3000)
+    x[::11] = np.nan
+    x[200:240] = 1.25  # constant run
+    return pd.Series(x)
+
+
+@pytest.mark.parametrize(("window", "min_periods"), [(20, 20), (96, 1), (50, 10)])
+def test_rolling_max_matches_pandas(
+    series: pd.Series, window: int, min_periods: int
+) -> None:
+    expected = series.rolling(window, min_periods=min_periods).max().to_numpy()
+    got = rolling.rolling_max(series.to_numpy(), window, min_periods)
+    np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize(("window", "min_periods"), [(20, 20), (96, 96), (50, 5)])
+def test_rolling_std_matches_pandas(
+    series: pd.Series, window: int, min_periods: int
+) -> None:
+    expected = series.rolling(window, min_periods=min_periods).std().to_numpy()
+    got = rolling.rolling_std(series.to_numpy(), window, min_periods)
+    np.testing.assert_array_equal(got, expected)
+
+
+def test_drawdown_matches_pandas() -> None:
+    steps = np.random.default_rng(1).normal(0, 0.01, 2000)
+    prices = pd.Series(100 * np.exp(np.cumsum(steps)))
+    peak = prices.rolling(288, min_periods=1).max()
+    np.testing.assert_array_equal(
+        rolling.drawdown(prices.to_numpy(), 288), ((prices - peak) / peak).to_numpy()
+    )
+
+
+@pytest.mark.parametrize(
+    ("kernel", "method"),
+    [
+        (rolling.rolling_median, "median"),
+        (moments.rolling_mean, "mean"),
+        (moments.rolling_skew, "skew"),
+        (moments.rolling_kurt, "kurt"),
+    ],
+)
+@pytest.mark.parametrize(("window", "min_periods"), [(20, 20), (96, 96), (50, 5)])
+def test_rolling_moments_match_pandas(
+    series: pd.Series,
+    kernel: Callable[[np.ndarray, int, int], np.ndarray],
+    method: str,
+    window: int,
+    min_periods: int,
+) -> None:
+    expected = getattr(series.rolling(window, min_periods=min_periods), method)()
+    got = kernel(series.to_numpy(), window, min_periods)
+    np.testing.assert_array_equal(got, expected.to_numpy())
+
+
+def test_rolling_amihud_matches_divided_rolling_mean(series: pd.Series) -> None:
+    volume = pd.Series(np.random.default_rng(3).lognormal(3.0, 1.0, len(series)))
+    volume[500:505] = 0.0  # inf / nan ratios
+    illiq = series.abs() / volume
+    expected = illiq.rolling(96).mean().to_numpy()
+    got = moments.rolling_amihud(series.abs().to_numpy(), volume.to_numpy(), 96, 96)
+    np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.parametrize("span", [32, 96, 384])
+def test_ewm_mean_matches_pandas(series: pd.Series, span: int) -> None:
+    expected = series.ewm(span=span).mean().to_numpy()
+    np.testing.assert_array_equal(ewm.ewm_mean(series.to_numpy(), span), expected)
+
+
+def test_dual_ema_ratio_matches_pandas(series: pd.Series) -> None:
+    k = 365 * 24 / 8
+    expected = (series.ewm(span=32).mean() / series.ewm(span=96).mean() - 1) * k
+    np.testing.assert_array_equal(
+        ewm.dual_ema_ratio(series.to_numpy(), 32, 96, k), expected.to_numpy()
+    )
+
+
+def test_fused_pipelines_match_per_signal_methods() -> None:
+    rng = np.random.default_rng(3)
+    n = 2500
+    close = pd.Series(30000 * np.exp(np.cumsum(rng.normal(0, 0.004, n))))
+    data = pd.DataFrame({"close": close, "volume": rng.uniform(50, 500, n)})
+    m = MarketArrays.from_frame(data)
+    returns = m.series(m.returns)
+
+    vol = VolatilitySignals({
+        "rv_window": 96, "vol_regime_short": 96, "vol_regime_long": 384,
+        "vov_window": 96, "vov_lookback": 80, "annualization_factor": 35040,
+    })
+    lev = LeverageSignals({
+        "funding_fast_window": 32, "funding_slow_window": 96,
+        "funding_stress_window": 120, "lcvi_window": 288,
+        "lcvi_vol_ref_window": 720, "annualization_factor": 35040,
+    })
+    micro = MicrostructureSignals({
+        "illiquidity_window": 96, "illiquidity_ref_window": 720,
+        "tail_risk_window": 96,
+    })
+
+    fused = vol.compute_all(m)
+    np.testing.assert_array_equal(
+        fused["realized_vol"], vol.realized_volatility(returns)
+    )
+    np.testing.assert_array_equal(fused["vol_regime"], vol.vol_regime(returns))
+    np.testing.assert_array_equal(fused["vol_of_vol"], vol.vol_of_vol(returns))
+
+    fused = lev.compute_all(m)
+    funding = lev.synthetic_funding_rate(close)
+    np.testing.assert_array_equal(fused["funding_proxy"], funding)
+    np.testing.assert_array_equal(fused["funding_stress"], lev.funding_stress(funding))
+    np.testing.assert_array_equal(fused["drawdown"], lev.drawdown(close))
+    np.testing.assert_array_equal(fused["dd_velocity"], lev.drawdown_velocity(close))
+    np.testing.assert_array_equal(fused["lcvi"], lev.lcvi(close, returns, funding))
+
+    fused = micro.compute_all(m)
+    volume = data["volume"]
+    np.testing.assert_array_equal(
+        fused["illiquidity"], micro.amihud_illiquidity(returns, volume)
+    )
+    np.testing.assert_array_equal(
+        fused["illiquidity_ratio"], micro.illiquidity_ratio(returns, volume)
+    )
+    np.testing.assert_array_equal(
+        fused["tail_risk_asym"], micro.tail_risk_asymmetry(returns)
+    )
+
+
+@pytest.mark.parametrize("shape", [-0.3, 0.0, 0.25, 0.8])
+def test_grimshaw_fit_is_at_least_as_likely_as_scipy(shape: float) -> None:
+    y = stats.genpareto.rvs(shape, scale=0.01, size=2000, random_state=11)
+    c_ref, _, s_ref = stats.genpareto.fit(y, floc=0)
+    c, s = gpd.gpd_fit_grimshaw(y)
+    ll = stats.genpareto.logpdf(y, c, 0, s).sum()
+    ll_ref = stats.genpareto.logpdf(y, c_ref, 0, s_ref).sum()
+    assert ll >= ll_ref - 1e-9
+    np.testing.assert_allclose((c, s), (c_ref, s_ref), rtol=1e-2, atol=1e-3)
+
+
+def test_rank_pct_cols_matches_pandas(series: pd.Series) -> None:
+    frame = pd.DataFrame({
+        "a": series,
+        "b": series.round(1),  # many ties
+        "c": np.nan,
+    })
+    np.testing.assert_array_equal(
+        rank.rank_pct_cols(frame.to_numpy()), frame.rank(pct=True).to_numpy()
+    )
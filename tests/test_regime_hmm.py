@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from flare_ai_defai.crash_detection_system.models.regime_hmm import (
+    HMM_AVAILABLE,
+    RegimeHMM,
+)
+
+pytestmark = pytest.mark.skipif(not HMM_AVAILABLE, reason="hmmlearn not installed")
+
+CONFIG = {
+    "n_components": 3,
+    "covariance_type": "full",
+    "n_iter": 200,
+    "random_state": 42,
+}
+
+
+@pytest.fixture
+def returns() -> pd.Series:
+    rng = np.random.default_rng(5)
+    scale = np.repeat([0.002, 0.006, 0.002, 0.015, 0.004], 300)
+    index = pd.date_range("2024-01-01", periods=len(scale), freq="15min")
+    r = pd.Series(rng.normal(0, scale), index=index)
+    r.iloc[0] = np.nan
+    return r
+
+
+def test_forward_extension_matches_filtered_posteriors(returns: pd.Series) -> None:
+    n_train = 1400
+    model = RegimeHMM(CONFIG).fit(returns.iloc[:n_train])
+    model.predict_proba(returns.iloc[:n_train])
+    assert model.extends_scored(returns, max_new=len(returns))
+
+    probs = model.predict_proba(returns).to_numpy()
+
+    # At each new bar the filtered distribution equals the full-series
+    # posterior of the prefix ending at that bar
+    obs = returns.dropna().to_numpy().reshape(-1, 1)
+    for t in range(n_train - 1, len(obs)):
+        expected = model.model.predict_proba(obs[: t + 1])[-1]
+        np.testing.assert_allclose(probs[t], expected, rtol=1e-9, atol=1e-12)
+
+
+def test_extension_respects_refit_budget(returns: pd.Series) -> None:
+    model = RegimeHMM(CONFIG).fit(returns.iloc[:1400])
+    model.predict_proba(returns.iloc[:1400])
+    assert not model.extends_scored(returns, max_new=50)
+    changed = returns.copy()
+    changed.iloc[10] += 1e-3
+    assert not model.extends_scored(changed, max_new=len(returns))
+
+
+@pytest.mark.parametrize("covariance_type", ["full", "diag", "spherical"])
+def test_regimes_sorted_by_variance(returns: pd.Series, covariance_type: str) -> None:
+    model = RegimeHMM({**CONFIG, "covariance_type": covariance_type}).fit(returns)
+    variances = model.model.covars_[:, 0, 0]
+    assert np.all(np.diff(variances) > 0)
+    np.testing.assert_allclose(model.model.transmat_.sum(axis=1), 1.0)
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from flare_ai_defai.exceptions import CircuitOpenError
+from flare_ai_defai.resilience import CircuitBreaker
+
+
+async def _fail() -> None:
+    raise RuntimeError
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _cancelled() -> None:
+    raise asyncio.CancelledError
+
+
+def test_cancelled_probe_reopens_circuit() -> None:
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=0.0)
+
+    async def scenario() -> None:
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        assert breaker.state == "open"
+
+        # The probe is cancelled: the circuit must not stay half-open
+        with pytest.raises(asyncio.CancelledError):
+            await breaker.call(_cancelled)
+        assert breaker.state == "open"
+
+        # After the cooldown the next probe goes through and closes it
+        assert await breaker.call(_ok) == "ok"
+        assert breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_open_circuit_fails_fast() -> None:
+    breaker = CircuitBreaker("test", fail_max=1, reset_timeout=60.0)
+
+    async def scenario() -> None:
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_ok)
+
+    asyncio.run(scenario())
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pandas as pd
+
+from flare_ai_defai.market_data.binance import KLINE_DTYPES
+from flare_ai_defai.market_data.store import (
+    append_candles,
+    compact_store,
+    last_open_time,
+)
+
+BAR_MS = 15 * 60 * 1000
+
+
+def _candles(start: int, n: int) -> pd.DataFrame:
+    open_time = [(start + i) * BAR_MS for i in range(n)]
+    frame = pd.DataFrame({c: range(n) for c in KLINE_DTYPES}).astype(KLINE_DTYPES)
+    frame["open_time"] = open_time
+    frame["close_time"] = [t + BAR_MS - 1 for t in open_time]
+    return frame
+
+
+def test_append_to_missing_store_writes_first_part(tmp_path: Path) -> None:
+    store = tmp_path / "klines.parquet"
+    assert last_open_time(store) == -1
+
+    candles = _candles(0, 3)
+    assert append_candles(store, candles) == len(candles)
+    assert last_open_time(store) == candles["open_time"].iloc[-1]
+
+
+def test_compaction_merges_appended_parts(tmp_path: Path) -> None:
+    store = tmp_path / "klines.parquet"
+    for start in range(0, 50, 5):
+        append_candles(store, _candles(start, 5))
+    first = min(store.glob("part-*.parquet"))
+
+    assert not compact_store(store, max_parts=10)
+    assert compact_store(store, max_parts=2)
+
+    # The backfill part is kept and everything after it is one part
+    kept, _merged = sorted(store.glob("part-*.parquet"))
+    assert kept == first
+    stored = pd.read_parquet(store)
+    assert stored["open_time"].tolist() == [i * BAR_MS for i in range(50)]
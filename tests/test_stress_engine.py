@@ -0,0 +1,41 @@
+import numpy as np
+
+from flare_ai_defai.risk_avatar.models import AvatarState, MarketState, RiskProfile
+from flare_ai_defai.risk_avatar.stress_engine import (
+    RISK_MODES,
+    update_avatar_state,
+    update_avatar_state_batch,
+)
+
+PROFILE = RiskProfile(
+    risk_level=50,
+    max_drawdown=0.15,
+    leverage_allowed=True,
+    stress_sensitivity=2.5,
+    reaction_speed=0.8,
+)
+
+
+def test_batch_matches_scalar_updates() -> None:
+    rng = np.random.default_rng(1)
+    n = 5000
+    level = np.repeat(rng.uniform(0, 1, n // 250), 250) ** 2  # calm/stressed spells
+    vol = np.abs(rng.normal(0, 0.3, n)) * level
+    dd = np.abs(rng.normal(0, 0.2, n)) * level
+    dd_speed = np.abs(rng.normal(0, 0.05, n)) * level
+    vol[4000] = np.nan
+
+    avatar = AvatarState(stress_level=20.0, risk_mode="calm")
+    stress, modes = [], []
+    for v, d, s in zip(vol, dd, dd_speed, strict=True):
+        market = MarketState(1.0, float(v), float(d), float(s), 0)
+        avatar = update_avatar_state(PROFILE, market, avatar)
+        stress.append(avatar.stress_level)
+        modes.append(avatar.risk_mode)
+
+    got_stress, got_modes = update_avatar_state_batch(
+        PROFILE, vol, dd, dd_speed, AvatarState(stress_level=20.0, risk_mode="calm")
+    )
+    np.testing.assert_array_equal(got_stress, stress)
+    assert [RISK_MODES[c] for c in got_modes] == modes
+    assert set(modes) == set(RISK_MODES)